@@ -1,11 +1,18 @@
+import asyncio
+import datetime
+import json
 import os
+import threading
+import time
 
-import arxiv
+import aiohttp
+import lxml.html
+import soupsieve
+from lxml import etree
 import requests
 from bs4 import BeautifulSoup
 import logging
 import re
-from datetime import datetime
 from dotenv import load_dotenv
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -13,12 +20,231 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
 from src.populate_csv_files.parse_pdf_files import parse_self_hosted_pdf
-from src.utils import root_directory, read_csv_links_and_referrers, quickSoup, return_driver, create_directory, download_pdf, download_and_save_paper, validate_pdfs
+from src.utils import root_directory, read_csv_links_and_referrers, fetch_page_async, DriverPool, create_directory, download_and_save_paper, validate_pdfs, save_pdf_validators, get_session, papers_pdf_directory, filter_seen_links, get_with_retry, MAX_CONCURRENT_PAPERS
 
 load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger('arxiv')
-logger.setLevel(logging.WARNING)
+
+
+ARXIV_API_URL = 'https://export.arxiv.org/api/query'
+ARXIV_API_DELAY = 3  # seconds between consecutive arXiv API calls, as required by the API terms of use
+ARXIV_ATOM_NAMESPACES = {'atom': 'http://www.w3.org/2005/Atom'}
+ARXIV_ID_LIST_MAX_SIZE = 100  # number of ids queried per arXiv API call
+ARXIV_VERSION_SUFFIX = re.compile(r'v\d+$')
+ARXIV_CACHE_EXPIRE_AFTER = 30 * 24 * 3600  # seconds during which cached Arxiv details are not queried again
+SEMANTIC_SCHOLAR_API_URL = 'https://api.semanticscholar.org/graph/v1/paper/'
+SEMANTIC_SCHOLAR_API_FIELDS = 'title,authors,publicationDate'
+# The 40 hexadecimal characters id closing paper URLs such as /paper/<title-slug>/<id>
+SEMANTIC_SCHOLAR_PAPER_ID = re.compile(r'/paper/(?:[^/]+/)?([0-9a-f]{40})\b')
+
+# Serializes the calls to the arXiv API and spaces them by ARXIV_API_DELAY: the only rate limit of arXiv requests,
+# see query_arxiv_api
+_ARXIV_API_LOCK = threading.Lock()
+_ARXIV_API_LAST_CALL = 0.0
+
+# Headless browsers shared by the Selenium-based parsers, started on first use and reused across papers
+DRIVER_POOL_SIZE = 4  # number of Chrome instances shared by the Selenium parsers
+DRIVER_POOL = DriverPool(size=DRIVER_POOL_SIZE, headless=True, block_resources=True, page_load_timeout=15)
+SELENIUM_WAIT_TIMEOUT = 10  # seconds to wait for the element holding the paper details to be rendered
+# Elements whose presence tells that the paper details are rendered, the conditions are stateless and shared
+RESEARCH_GATE_LOADED = EC.presence_of_element_located((By.CSS_SELECTOR, 'h1.nova-legacy-e-text'))
+SCIENCEDIRECT_LOADED = EC.presence_of_element_located((By.CSS_SELECTOR, '.title-text'))
+SEMANTIC_SCHOLAR_LOADED = EC.presence_of_element_located((By.CSS_SELECTOR, '.fresh-paper-detail-page__header h1'))
+
+SSRN_NOT_FOUND_MARKER = b'The abstract you requested was not found'  # probed in the raw page before parsing it
+SSRN_XPATHS = {
+    'title': etree.XPath('string(//h1)'),
+    'authors': etree.XPath('//div[contains(@class, "authors")]//a//text()'),
+    # The date of the last revision is preferred over the date of the first posting, only the first match is used
+    'last_revised_date': etree.XPath('(//text()[contains(., "Last revised:")])[1]'),
+    'posted_date': etree.XPath('(//text()[contains(., "Posted:")])[1]'),
+    'pdf_relative_link': etree.XPath('(//div[contains(@class, "abstract-buttons")])[1]/div[1]/a[1]/@href'),
+}
+# IACR pages are parsed with lxml like SSRN pages, positional steps mirror the former CSS selectors' nth-child
+IACR_XPATHS = {
+    'title': etree.XPath('//head/title'),
+    'bibtex': etree.XPath('//*[@id="bibtex"]'),
+    'release_date': etree.XPath('//*[@id="metadata"]/*[2][self::dl]/*[12][self::dd]'),
+    'release_date_fallback': etree.XPath('//*[@id="metadata"]/*[2][self::dl]/*[10][self::dd]'),
+}
+# DL-ACM pages only need three fields and are parsed with lxml as well, the class predicates match a class
+# among the space-separated ones as the former CSS class selectors did
+DL_ACM_XPATHS = {
+    'title': etree.XPath('//*[contains(concat(" ", normalize-space(@class), " "), " citation__title ")]'),
+    'author_names': etree.XPath('//li[contains(concat(" ", normalize-space(@class), " "), " loa__item ")]'
+                                '//img[contains(concat(" ", normalize-space(@class), " "), " author-picture ")]/@alt'),
+    'release_date': etree.XPath('//*[contains(concat(" ", normalize-space(@class), " "), " CitationCoverDate ")]'),
+}
+# Nature pages too, the positional steps mirror the nth-child of the former CSS selectors
+NATURE_XPATHS = {
+    'article_type': etree.XPath('//*[contains(concat(" ", normalize-space(@class), " "), " c-article-identifiers__type ")]'),
+    'article_type_fallback': etree.XPath('//*/*[1][self::li][contains(concat(" ", normalize-space(@class), " "), " c-article-identifiers__item ")]'),
+    'magazine_title': etree.XPath('//*[contains(concat(" ", normalize-space(@class), " "), " c-article-magazine-title ")]'),
+    'author_list': etree.XPath('//*[contains(concat(" ", normalize-space(@class), " "), " c-article-author-list ")]'),
+    'release_date': etree.XPath('//*/*[2][self::li][contains(concat(" ", normalize-space(@class), " "), " c-article-identifiers__item ")]/*[1][self::time]'),
+    'title': etree.XPath('//*[contains(concat(" ", normalize-space(@class), " "), " c-article-title ")]'),
+    'news_release_date': etree.XPath('//*/*[2][self::li][contains(concat(" ", normalize-space(@class), " "), " c-article-identifiers__item ")]/*[1][self::a]/*[1][self::time]'),
+}
+IACR_BIBTEX_AUTHOR = re.compile(r'author\s*=\s*\{([^}]*)\}')
+IACR_AUTHOR_NOISE = str.maketrans('', '', "[]'")  # characters removed from the bibtex author names
+AUTHOR_NON_LETTERS = re.compile(r'[^a-zA-Z, ]')
+WHITESPACES = re.compile(r'\s+')
+MONTH_YEAR = re.compile(r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\b')
+AFFILIATION_KEYWORDS = re.compile(r'university|institute|school', flags=re.IGNORECASE)
+MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December')
+MONTH_NUMBERS = {**{name: number for number, name in enumerate(MONTH_NAMES, 1)}, **{name[:3]: number for number, name in enumerate(MONTH_NAMES, 1)}}
+
+# CSS selectors of the fields of each site, compiled once rather than matched from their text on every page
+RESEARCH_GATE_SELECTORS = {
+    'title': soupsieve.compile('h1.nova-legacy-e-text'),
+    'authors': soupsieve.compile('.nova-legacy-l-flex .research-detail-author-list__item a'),
+    'release_date': soupsieve.compile('div.nova-legacy-e-text--spacing-xxs:nth-child(1) > ul:nth-child(1) > li:nth-child(1)'),
+}
+SCIENCEDIRECT_SELECTORS = {
+    'title': soupsieve.compile('.title-text'),
+    'author_items': soupsieve.compile('.react-xocs-alternative-link'),
+    'given_name': soupsieve.compile('.given-name'),
+    'surname': soupsieve.compile('.text.surname'),
+    'release_date': soupsieve.compile('div.text-xs:nth-child(2)'),
+}
+SEMANTIC_SCHOLAR_SELECTORS = {
+    'title': soupsieve.compile('.fresh-paper-detail-page__header > h1:nth-child(2)'),
+    'author_list': soupsieve.compile('.author-list__link'),
+    'release_date': soupsieve.compile('li.paper-meta-item:nth-child(2) > span:nth-child(1) > span:nth-child(1) > span:nth-child(1) > span:nth-child(1)'),
+}
+
+
+def release_date_from_text(date_string: str) -> str:
+    """
+    Convert a publication date written as 'day month year' or 'month year' (e.g. '3 January 2024', '3 Jan 2024',
+    'January 2024') to the yyyy-mm-dd format of the CSV, the first of the month if there is no day.
+    Equivalent to datetime.strptime with '%d %B %Y', '%d %b %Y' or '%B %Y', without its per-call format matching.
+
+    Raises:
+    - ValueError: If the text is not a date in one of these formats.
+    """
+    parts = date_string.split()
+    if len(parts) == 2:
+        parts.insert(0, '1')
+    try:
+        day, month, year = parts
+        # datetime.date rejects the days the month does not have, as strptime does
+        return datetime.date(int(year), MONTH_NUMBERS[month], int(day)).isoformat()
+    except (KeyError, ValueError):
+        raise ValueError(f"Unrecognized date: {date_string!r}")
+
+
+def arxiv_id_from_url(arxiv_url: str) -> str:
+    return arxiv_url.replace('.pdf', '').split('/')[-1]
+
+
+def arxiv_entry_to_details(entry: etree._Element) -> dict:
+    # Read the details of a paper from an <entry> element of the API Atom feed, start topics with 'arXiv'
+    arxiv_id_url = entry.findtext('atom:id', namespaces=ARXIV_ATOM_NAMESPACES)
+    pdf_links = entry.xpath('atom:link[@title="pdf"]/@href', namespaces=ARXIV_ATOM_NAMESPACES)
+    return {
+        'title': ' '.join(entry.findtext('atom:title', namespaces=ARXIV_ATOM_NAMESPACES).split()),  # titles are wrapped over several lines in the feed
+        'authors': ", ".join([name.text for name in entry.iterfind('atom:author/atom:name', namespaces=ARXIV_ATOM_NAMESPACES)]),
+        'pdf_link': pdf_links[0] if pdf_links else arxiv_id_url.replace('/abs/', '/pdf/'),
+        'topics': ", ".join(['arXiv'] + [category.get('term') for category in entry.iterfind('atom:category', namespaces=ARXIV_ATOM_NAMESPACES)]),
+        'release_date': entry.findtext('atom:published', namespaces=ARXIV_ATOM_NAMESPACES)[:10]  # 'YYYY-MM-DDTHH:MM:SSZ'
+    }
+
+
+def query_arxiv_api(arxiv_ids: list) -> bytes:
+    """
+    Query the Atom feed of the arXiv export API for a list of ids.
+    Calls are serialized across threads and spaced by at least ARXIV_API_DELAY seconds.
+
+    Returns:
+    - bytes: The Atom feed.
+    """
+    global _ARXIV_API_LAST_CALL
+    with _ARXIV_API_LOCK:
+        wait = ARXIV_API_DELAY - (time.monotonic() - _ARXIV_API_LAST_CALL)
+        if wait > 0:
+            time.sleep(wait)
+        try:
+            response = get_session().get(ARXIV_API_URL, params={'id_list': ','.join(arxiv_ids), 'max_results': len(arxiv_ids)}, timeout=30)
+        finally:
+            _ARXIV_API_LAST_CALL = time.monotonic()
+    response.raise_for_status()
+    return response.content
+
+
+def fetch_arxiv_details(arxiv_ids: list) -> dict:
+    """
+    Retrieve the details of Arxiv papers with one API call per chunk of ARXIV_ID_LIST_MAX_SIZE ids.
+
+    Parameters:
+    - arxiv_ids (list): The Arxiv IDs of the papers, with or without version suffix.
+
+    Returns:
+    - dict: A mapping from Arxiv ID (as requested) to the paper details.
+    """
+    details_by_id = {}
+    for i in range(0, len(arxiv_ids), ARXIV_ID_LIST_MAX_SIZE):
+        chunk = arxiv_ids[i:i + ARXIV_ID_LIST_MAX_SIZE]
+        # The API may return the latest version of a requested unversioned ID, match both forms
+        requested = {ARXIV_VERSION_SUFFIX.sub('', arxiv_id): arxiv_id for arxiv_id in chunk}
+        requested.update({arxiv_id: arxiv_id for arxiv_id in chunk})
+        try:
+            for entry in etree.fromstring(query_arxiv_api(chunk)).iterfind('atom:entry', namespaces=ARXIV_ATOM_NAMESPACES):
+                short_id = entry.findtext('atom:id', namespaces=ARXIV_ATOM_NAMESPACES).rsplit('/abs/', 1)[-1]
+                arxiv_id = requested.get(short_id) or requested.get(ARXIV_VERSION_SUFFIX.sub('', short_id))
+                if arxiv_id:
+                    details_by_id[arxiv_id] = arxiv_entry_to_details(entry)
+        except Exception as e:
+            logging.error(f"Failed to fetch details for Arxiv IDs {chunk[0]}...{chunk[-1]}. Error: {e}")
+    return details_by_id
+
+
+def fetch_all_arxiv_metadata(arxiv_urls: list) -> dict:
+    """
+    Retrieve the details of many Arxiv papers in bulk with fetch_arxiv_details.
+    Fetched details are cached in data/links/arxiv_id_to_details_mapping.json and not queried again
+    for ARXIV_CACHE_EXPIRE_AFTER.
+
+    Parameters:
+    - arxiv_urls (list): The Arxiv URLs (or IDs) of the papers.
+
+    Returns:
+    - dict: A mapping from Arxiv ID (as found in the URL) to the paper details.
+    """
+    # Details of the papers fetched by previous runs are cached on disk, only query the new or expired ids
+    cache_file = os.path.join(root_directory(), 'data', 'links', 'arxiv_id_to_details_mapping.json')
+    cache = {}
+    if os.path.exists(cache_file):
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    now = time.time()
+    arxiv_ids = list(dict.fromkeys(arxiv_id_from_url(url) for url in arxiv_urls))
+    # Entries written before fetched_at was recorded have none and are refreshed once
+    details_by_id = {arxiv_id: cache[arxiv_id]['details'] for arxiv_id in arxiv_ids
+                     if arxiv_id in cache and now - cache[arxiv_id].get('fetched_at', 0) < ARXIV_CACHE_EXPIRE_AFTER}
+    arxiv_ids = [arxiv_id for arxiv_id in arxiv_ids if arxiv_id not in details_by_id]
+    logging.info(f"[arXiv] {len(details_by_id)} papers already known, querying the details of {len(arxiv_ids)} new papers")
+    if arxiv_ids:
+        new_details_by_id = fetch_arxiv_details(arxiv_ids)
+        details_by_id.update(new_details_by_id)
+        cache.update({arxiv_id: {'details': details, 'fetched_at': now} for arxiv_id, details in new_details_by_id.items()})
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False, indent=4)
+    return details_by_id
+
+
+def get_paper_details_from_arxiv_batch(arxiv_urls: list) -> dict:
+    """
+    Retrieve the details of many Arxiv papers in bulk with fetch_all_arxiv_metadata.
+
+    Parameters:
+    - arxiv_urls (list): The URLs of the papers on Arxiv.
+
+    Returns:
+    - dict: A mapping from paper URL to the paper details, for the papers found.
+    """
+    details_by_id = fetch_all_arxiv_metadata(arxiv_urls)
+    return {url: details_by_id[arxiv_id_from_url(url)] for url in arxiv_urls if arxiv_id_from_url(url) in details_by_id}
 
 
 def get_paper_details_from_arxiv(arxiv_url: str) -> dict or None:
@@ -26,89 +252,83 @@ def get_paper_details_from_arxiv(arxiv_url: str) -> dict or None:
        Retrieve paper details from Arxiv using its ID.
 
        Parameters:
-       - arxiv_id (str): The ID of the paper on Arxiv.
+       - arxiv_url (str): The URL of the paper on Arxiv.
 
        Returns:
        - dict: A dictionary containing details about the paper such as title, authors, pdf link, topics, and release date.
        - None: If there's an error during retrieval.
    """
-    arxiv_id = arxiv_url.split('/')[-1]
-    try:
-        search = arxiv.Search(id_list=[arxiv_id])
-        paper = next(search.results())
-
-        # start list of paper.categories with 'arXiv'
-        paper.categories = ['arXiv'] + paper.categories
-
-        details = {
-            'title': paper.title,
-            'authors': ", ".join([author.name for author in paper.authors]),
-            'pdf_link': paper.pdf_url,
-            'topics': ", ".join(paper.categories),
-            'release_date': paper.published.strftime('%Y-%m-%d')  # formatting date to 'YYYY-MM-DD' string format
-        }
-        return details
-    except Exception as e:
-        logging.error(f"Failed to fetch details for {arxiv_id}. Error: {e}")
+    arxiv_id = arxiv_id_from_url(arxiv_url)
+    details = fetch_arxiv_details([arxiv_id]).get(arxiv_id)
+    if details is None:
+        logging.error(f"Failed to fetch details for {arxiv_id}")
+    return details
+
+
+def parse_ssrn_page(page_path: str) -> dict or None:
+    """
+    Parse a fetched SSRN abstract page and extract the paper details with targeted XPath queries.
+    lxml parses the file incrementally, the whole page is never held in memory as a string.
+
+    Returns:
+    - dict: The details of the paper, without topics.
+    - None: If one of the fields is not found, e.g. after a change of the page layout.
+    """
+    tree = lxml.html.parse(page_path).getroot()
+    title = SSRN_XPATHS['title'](tree).strip()
+    # Author names may be repeated (e.g. once per affiliation): keep the first occurrence of each
+    authors = list(dict.fromkeys(text.strip() for text in SSRN_XPATHS['authors'](tree) if text.strip()))
+    dates = SSRN_XPATHS['last_revised_date'](tree) or SSRN_XPATHS['posted_date'](tree)
+    pdf_relative_links = SSRN_XPATHS['pdf_relative_link'](tree)
+    if not (title and authors and dates and pdf_relative_links):
         return None
 
+    date = dates[0].split(':', 1)[-1].strip()
+    return {
+        'title': title,
+        'authors': ', '.join(authors),
+        'pdf_link': f"https://papers.ssrn.com/sol3/{pdf_relative_links[0]}",
+        'release_date': release_date_from_text(date)
+    }
+
+
+def page_contains(page_path: str, marker: bytes) -> bool:
+    """
+    Tell whether a fetched page contains a byte string.
+    """
+    with open(page_path, 'rb') as f:
+        return marker in f.read()
 
-def get_paper_details_from_ssrn(url: str) -> dict or None:
+
+async def get_paper_details_from_ssrn(url: str, session: aiohttp.ClientSession) -> dict or None:
     """
-    Retrieve paper details from an SSRN URL and download the paper if it doesn't exist locally.
+    Retrieve paper details from an SSRN URL. The PDF itself is downloaded by the caller with the same session.
 
     Parameters:
     - url (str): The URL of the SSRN paper.
+    - session (aiohttp.ClientSession): The shared session to fetch the page with.
 
     Returns:
     - dict: A dictionary containing details about the paper.
     - None: If there's an error during retrieval or the abstract is not found.
     """
     try:
-        article = quickSoup(url)
-        t = article.get_text()
-        if "The abstract you requested was not found" in t:
-            return None  # Return None for articles that aren't found
-
-        def ordered_set_from_list(input_list):
-            return list(dict.fromkeys(input_list).keys())
-
-        title = article.find('h1').get_text().replace("\n", "").strip()
-        test_list = ordered_set_from_list(t.split("\n"))
-        authors = test_list[1].replace(title, "").replace(" :: SSRN", "").replace(" by ", "").replace(", ", ":").strip().replace(':', ', ')
-
-        date = [line.replace("Last revised: ", "") for line in test_list if "Last revised: " in line]
-        if not date:
-            date = [line.replace("Posted: ", "") for line in test_list if "Posted: " in line]
-        date = date[0].strip()
-        original_date = datetime.strptime(date, '%d %b %Y')
-        formatted_date = original_date.strftime('%Y-%m-%d')
-
-        pdf_relative_link = article.select_one("div.abstract-buttons:nth-child(1) > div:nth-child(1) > a:nth-child(1)")['href']
-        pdf_link = f"https://papers.ssrn.com/sol3/{pdf_relative_link}"
-
-        # Check if the paper is already downloaded
-        pdf_directory = os.path.join(root_directory(), 'data', 'papers_pdf_downloads')
-        pdf_filename = f"{title}.pdf"
-        pdf_path = os.path.join(pdf_directory, pdf_filename)
-
-        # Download the paper if it doesn't exist locally
-        if not os.path.exists(pdf_path):
-            pdf_content = download_pdf(pdf_link, url)
-            if pdf_content:
-                with open(pdf_path, "wb") as f:
-                    f.write(pdf_content)
-            else:
-                logging.warning(f"[SSRN] Failed to download a valid PDF file from {pdf_link}")
-
-        details = {
-            'title': title,
-            'authors': authors,
-            'pdf_link': pdf_link,
-            'topics': 'SSRN',
-            'release_date': formatted_date
-        }
-        logging.info(f"[SSRN] Successfully downloaded {title}")
+        page_path = await fetch_page_async(session, url)
+        if page_path is None:
+            logging.error(f"[SSRN] Failed to fetch {url}")
+            return None
+
+        # Missing abstracts are told from the raw bytes, without building a tree for them
+        if await asyncio.to_thread(page_contains, page_path, SSRN_NOT_FOUND_MARKER):
+            return None
+
+        # Parsing and the XPath queries, which scan the text of the whole page, are CPU-bound: keep both off the event loop
+        details = await asyncio.to_thread(parse_ssrn_page, page_path)
+        if details is None:
+            logging.error(f"[SSRN] Unexpected page layout for {url}")
+            return None
+        details['topics'] = 'SSRN'
+        logging.info(f"[SSRN] Successfully fetched details for {details['title']}")
         return details
 
     except Exception as e:
@@ -116,165 +336,163 @@ def get_paper_details_from_ssrn(url: str) -> dict or None:
         return None
 
 
-def get_paper_details_from_iacr(url: str):
+def xpath_text(tree: lxml.html.HtmlElement, xpath: etree.XPath) -> str:
+    """
+    Return the text of the first element matched by a compiled XPath.
+
+    Raises:
+    - AttributeError: If no element matches, as BeautifulSoup's select_one(...).get_text() would.
+    """
+    elements = xpath(tree)
+    if not elements:
+        raise AttributeError(f"No element matches {xpath.path}")
+    return elements[0].text_content()
+
+
+def parse_iacr_page(page_path: str, url: str):
     try:
-        response = requests.get(url.replace('.pdf', ''))
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        tree = lxml.html.parse(page_path).getroot()
 
-        # select the bibtex with css selector #bibtex
-        # extract authors from such string template # author = {author1 and author2 and author3}
+        # extract authors from the bibtex, such string template # author = {author1 and author2 and author3}
 
-        paper_title = soup.select_one('head > title:nth-child(4)').get_text()
+        paper_title = xpath_text(tree, IACR_XPATHS['title'])
 
-        bibtex = soup.select_one('#bibtex').get_text()
+        bibtex = xpath_text(tree, IACR_XPATHS['bibtex'])
         # Extract authors using regular expression
-        authors_match = re.findall(r'author = {(.*)}', bibtex)
+        authors_match = IACR_BIBTEX_AUTHOR.search(bibtex)
         if authors_match:
-            paper_authors = ', '.join([author.strip().replace('[', '').replace(']', '').replace("'", '') for author in authors_match[0].split(' and ')])
+            paper_authors = ', '.join([author.strip().translate(IACR_AUTHOR_NOISE) for author in authors_match.group(1).split(' and ')])
         else:
             paper_authors = ''
 
-        paper_release_date = soup.select_one('#metadata > dl:nth-child(2) > dd:nth-child(12)').get_text().strip()
+        paper_release_date = xpath_text(tree, IACR_XPATHS['release_date']).strip()
         if 'See all versions' in paper_release_date:
-            paper_release_date = soup.select_one('#metadata > dl:nth-child(2) > dd:nth-child(10)').get_text().strip()
+            paper_release_date = xpath_text(tree, IACR_XPATHS['release_date_fallback']).strip()
         if ':' in paper_release_date:
             paper_release_date = paper_release_date.split(':')[0].strip()
 
-        # Check if the paper is already downloaded
-        pdf_directory = os.path.join(root_directory(), 'data', 'papers_pdf_downloads')
-        pdf_filename = f"{paper_title}.pdf"
-        pdf_path = os.path.join(pdf_directory, pdf_filename)
-
-        # Download the paper if it doesn't exist locally
-        if not os.path.exists(pdf_path):
-            pdf_content = download_pdf(f"{url}.pdf", url)
-            if pdf_content:
-                with open(pdf_path, "wb") as f:
-                    f.write(pdf_content)
-                logging.info(f"[IACR] Successfully downloaded [{paper_title}]")
-            else:
-                logging.warning(f"[IACR] Failed to download a valid PDF file from {url}")
-
-        return {"title": paper_title.strip(), "authors": paper_authors.strip(), "pdf_link": url.strip(), "topics": 'iacr', "release_date": paper_release_date.strip()}
-    except requests.exceptions.RequestException as e:
-        logging.error(f"[IACR] Failed to fetch the paper details: {e}")
-        return None
-    except AttributeError as e:
+        # The listed link is the paper page, the PDF itself is downloaded from the page URL suffixed with .pdf
+        return {"title": paper_title.strip(), "authors": paper_authors.strip(), "pdf_link": url.strip(), "pdf_download_link": f"{url.strip()}.pdf", "topics": 'iacr', "release_date": paper_release_date.strip()}
+    except Exception as e:
         logging.error(f"[IACR] Failed to parse the paper details: {e}")
         return None
 
 
-def get_paper_details_from_dl_acm(url: str):
+def parse_dl_acm_page(page_path: str, url: str):
     try:
-        response = requests.get(url.replace('.pdf', ''))
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        tree = lxml.html.parse(page_path).getroot()
 
-        paper_title = soup.select_one('.citation__title').get_text()
+        paper_title = xpath_text(tree, DL_ACM_XPATHS['title'])
 
-        # Get Paper Authors
-        # Select all <li> elements with class "loa__item"
-        author_items = soup.select('li.loa__item')
-
-        # Initialize a list to store the extracted author names
-        paper_authors = []
+        # The author names are the alt text of the author pictures of the author list
+        author_names = DL_ACM_XPATHS['author_names'](tree)
+        paper_authors = ', '.join(name.strip() for name in author_names if name.strip())
 
-        # Loop through the author items
-        for author_item in author_items:
-            # Find the <img> element within the author item
-            img_element = author_item.select_one('img.author-picture')
+        date_string = xpath_text(tree, DL_ACM_XPATHS['release_date'])
 
-            # Extract the author name from the alt attribute of the <img> element
-            if img_element:
-                author_name = img_element.get_text()
-                if author_name:
-                    paper_authors.append(author_name)
-
-        # join all authors in paper_authors in a single string separated with comma and space
-        paper_authors = ', '.join(paper_authors)
-
-        date_string = soup.select_one('.CitationCoverDate').get_text()
-
-        # Parse the date string
-        date_obj = datetime.strptime(date_string, '%d %B %Y')
-
-        # Format the date as yyyy-mm-dd
-        paper_release_date = date_obj.strftime('%Y-%m-%d')
+        paper_release_date = release_date_from_text(date_string)
 
         return {"title": paper_title, "authors": paper_authors, "pdf_link": url, "topics": 'DL-ACM', "release_date": paper_release_date}
-    except requests.exceptions.RequestException as e:
-        logging.error(f"[DL ACM] Failed to fetch the paper details: {e}")
-        return None
-    except AttributeError as e:
+    except Exception as e:
         logging.error(f"[DL ACM] Failed to parse the paper details: {e}")
         return None
 
 
-def get_paper_details_from_nature(url: str):
+def parse_nature_page(page_path: str, url: str):
     try:
-        response = requests.get(url.replace('.pdf', ''))
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        tree = lxml.html.parse(page_path).getroot()
 
         try:
-            article_identifier = soup.select_one('.c-article-identifiers__type').get_text()
+            article_identifier = xpath_text(tree, NATURE_XPATHS['article_type'])
         except AttributeError:
-            article_identifier = soup.select_one('li.c-article-identifiers__item:nth-child(1)').get_text()
+            article_identifier = xpath_text(tree, NATURE_XPATHS['article_type_fallback'])
 
         if article_identifier == 'COMMENT':
-            paper_title = soup.select_one('.c-article-magazine-title').get_text()
+            paper_title = xpath_text(tree, NATURE_XPATHS['magazine_title'])
 
             # Select the .c-article-author-list element
-            author_list_text = soup.select_one('.c-article-author-list').get_text()
+            author_list_text = xpath_text(tree, NATURE_XPATHS['author_list'])
 
             # Remove non-alphabet characters, split the text by commas, and clean up spaces
-            paper_authors = ', '.join([re.sub(r'[^a-zA-Z, ]', '', author.replace('&', ',')).strip() for author in author_list_text.split(',')])
+            paper_authors = ', '.join([AUTHOR_NON_LETTERS.sub('', author.replace('&', ',')).strip() for author in author_list_text.split(',')])
 
-            paper_authors = re.sub(r'\s+', ' ', paper_authors)  # Replace multiple spaces with a single space
+            paper_authors = WHITESPACES.sub(' ', paper_authors)  # Replace multiple spaces with a single space
 
             # get published date
-            date_string = soup.select_one('li.c-article-identifiers__item:nth-child(2) > time:nth-child(1)').get_text()
-            date_obj = datetime.strptime(date_string, '%d %B %Y')  # Parse the date string
-            paper_release_date = date_obj.strftime('%Y-%m-%d')  # Format the date as yyyy-mm-dd
+            date_string = xpath_text(tree, NATURE_XPATHS['release_date'])
+            paper_release_date = release_date_from_text(date_string)  # Format the date as yyyy-mm-dd
 
         elif article_identifier == 'News & Views':
-            paper_title = soup.select_one('.c-article-title').get_text()
+            paper_title = xpath_text(tree, NATURE_XPATHS['title'])
 
             # Select the .c-article-author-list element
-            author_list_text = soup.select_one('.c-article-author-list').get_text().split('\n')[0]
+            author_list_text = xpath_text(tree, NATURE_XPATHS['author_list']).split('\n')[0]
 
             # Remove non-alphabet characters, split the text by commas, and clean up spaces
-            paper_authors = ', '.join([re.sub(r'[^a-zA-Z, ]', '', author.replace('&', ',')).strip() for author in author_list_text.split(',')])
+            paper_authors = ', '.join([AUTHOR_NON_LETTERS.sub('', author.replace('&', ',')).strip() for author in author_list_text.split(',')])
 
-            paper_authors = re.sub(r'\s+', ' ', paper_authors)  # Replace multiple spaces with a single space
+            paper_authors = WHITESPACES.sub(' ', paper_authors)  # Replace multiple spaces with a single space
 
-            date_string = soup.select_one('li.c-article-identifiers__item:nth-child(2) > a:nth-child(1) > time:nth-child(1)').get_text()
-            date_obj = datetime.strptime(date_string, '%d %B %Y')  # Parse the date string
-            paper_release_date = date_obj.strftime('%Y-%m-%d')  # Format the date as yyyy-mm-dd
+            date_string = xpath_text(tree, NATURE_XPATHS['news_release_date'])
+            paper_release_date = release_date_from_text(date_string)  # Format the date as yyyy-mm-dd
+
+        else:
+            logging.error(f"[Nature] Unsupported article type {article_identifier!r} for {url}")
+            return None
 
         return {"title": paper_title, "authors": paper_authors, "pdf_link": url, "topics": 'Nature', "release_date": paper_release_date}
-    except requests.exceptions.RequestException as e:
-        logging.error(f"[Nature] Failed to fetch the paper details: {e}")
+    except Exception as e:
+        logging.error(f"[Nature] Failed to parse the paper details: {e}")
         return None
-    except AttributeError as e:
-        print(f"Failed to parse the paper details: {e}")
+
+
+async def fetch_and_parse_page(session: aiohttp.ClientSession, url: str, parse_page, site_name: str) -> dict or None:
+    """
+    Fetch the page of a paper with the shared session and parse it off the event loop.
+
+    Parameters:
+    - session (aiohttp.ClientSession): The shared session to fetch the page with.
+    - url (str): The URL of the paper page.
+    - parse_page (function): Module-level parser taking the path of the fetched page and the URL, returning the paper details.
+      It runs in a worker thread.
+    - site_name (str): Name of the site, for logging.
+
+    Returns:
+    - dict: The paper details.
+    - None: If there's an error during retrieval or parsing.
+    """
+    page_path = await fetch_page_async(session, url.replace('.pdf', ''))
+    if page_path is None:
+        logging.error(f"[{site_name}] Failed to fetch the paper details of {url}")
         return None
+    # Keep the parsing off the event loop, lxml releases the GIL while it parses the page
+    return await asyncio.to_thread(parse_page, page_path, url)
+
+
+async def get_paper_details_from_iacr(url: str, session: aiohttp.ClientSession):
+    return await fetch_and_parse_page(session, url, parse_iacr_page, 'IACR')
+
+
+async def get_paper_details_from_dl_acm(url: str, session: aiohttp.ClientSession):
+    return await fetch_and_parse_page(session, url, parse_dl_acm_page, 'DL ACM')
+
+
+async def get_paper_details_from_nature(url: str, session: aiohttp.ClientSession):
+    return await fetch_and_parse_page(session, url, parse_nature_page, 'Nature')
 
 
 def get_paper_details_from_research_gate(url: str):
     try:
-        driver = return_driver()
-
-        driver.get(url.replace('.pdf', ''))
-        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, 'h1.nova-legacy-e-text')))
+        with DRIVER_POOL.driver() as driver:
+            driver.get(url.replace('.pdf', ''))
+            WebDriverWait(driver, SELENIUM_WAIT_TIMEOUT).until(RESEARCH_GATE_LOADED)
 
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = BeautifulSoup(driver.page_source, 'lxml')
 
-        paper_title = soup.select_one('h1.nova-legacy-e-text').get_text()
+        paper_title = RESEARCH_GATE_SELECTORS['title'].select_one(soup).get_text()
 
         # Loop through the author list
-        authors = soup.select('.nova-legacy-l-flex .research-detail-author-list__item a')
+        authors = RESEARCH_GATE_SELECTORS['authors'].select(soup)
         paper_authors = [author.get_text().strip() for author in authors if author]
         # remove empty strings or only spaces
         paper_authors = [author for author in paper_authors if author.strip()]
@@ -282,17 +500,13 @@ def get_paper_details_from_research_gate(url: str):
         paper_authors = list(dict.fromkeys(paper_authors))
 
         # Try some manual cleaning and see if that goes through
-        paper_authors = [author for author in paper_authors if not re.search(r'university|institute|school', author, flags=re.IGNORECASE)]
+        paper_authors = [author for author in paper_authors if not AFFILIATION_KEYWORDS.search(author)]
         # join all authors in paper_authors in a single string separated with comma and space
         paper_authors = ', '.join(paper_authors)
 
-        date_string = soup.select_one('div.nova-legacy-e-text--spacing-xxs:nth-child(1) > ul:nth-child(1) > li:nth-child(1)').get_text()
-
-        # Parse the date string
-        date_obj = datetime.strptime(date_string, '%B %Y')
+        date_string = RESEARCH_GATE_SELECTORS['release_date'].select_one(soup).get_text()
 
-        # Format the date as yyyy-mm-dd
-        paper_release_date = date_obj.strftime('%Y-%m-%d')
+        paper_release_date = release_date_from_text(date_string)
 
         # TODO 2023-12-17: retrieve .pdf URL from researchGate else use selenium
         # Check if the paper is already downloaded
@@ -318,24 +532,21 @@ def get_paper_details_from_research_gate(url: str):
     except Exception as e:
         print(f"Failed to fetch or parse the paper details: {e}")
         return None
-    finally:
-        driver.quit()
 
 
 def get_paper_details_from_sciendirect(url: str):
     try:
-        driver = return_driver()
+        with DRIVER_POOL.driver() as driver:
+            driver.get(url.replace('.pdf', ''))
+            WebDriverWait(driver, SELENIUM_WAIT_TIMEOUT).until(SCIENCEDIRECT_LOADED)
 
-        driver.get(url.replace('.pdf', ''))
-        WebDriverWait(driver, 10)
+            soup = BeautifulSoup(driver.page_source, 'lxml')
 
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-
-        paper_title = soup.select_one('.title-text').get_text()
+        paper_title = SCIENCEDIRECT_SELECTORS['title'].select_one(soup).get_text()
 
         # Get Paper Authors
         # Select all <li> elements with class "loa__item"
-        author_items = soup.select('.react-xocs-alternative-link')
+        author_items = SCIENCEDIRECT_SELECTORS['author_items'].select(soup)
 
         # Initialize a list to store the extracted author names
         author_names = []
@@ -343,8 +554,8 @@ def get_paper_details_from_sciendirect(url: str):
         # Loop through the author items
         for author_item in author_items:
             # Find the <span> elements with class "given-name" and "text surname"
-            given_name = author_item.select_one('.given-name').get_text()
-            surname = author_item.select_one('.text.surname').get_text()
+            given_name = SCIENCEDIRECT_SELECTORS['given_name'].select_one(author_item).get_text()
+            surname = SCIENCEDIRECT_SELECTORS['surname'].select_one(author_item).get_text()
 
             # Concatenate the given name and surname without spaces
             full_name = f"{given_name} {surname}"
@@ -358,13 +569,10 @@ def get_paper_details_from_sciendirect(url: str):
         # Remove extra spaces and clean up the string
         paper_authors = ' '.join(paper_authors.split())  # Remove extra spaces
 
-        date_string = soup.select_one('div.text-xs:nth-child(2)').get_text()
-
-        # Define a regular expression pattern for "Month Year" format
-        pattern = r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\b'
+        date_string = SCIENCEDIRECT_SELECTORS['release_date'].select_one(soup).get_text()
 
-        # Search for the pattern in the input string
-        match = re.search(pattern, date_string)
+        # Search for the "Month Year" pattern in the input string
+        match = MONTH_YEAR.search(date_string)
 
         if match:
             date_string = match.group()
@@ -372,13 +580,12 @@ def get_paper_details_from_sciendirect(url: str):
             print("Date not found in the input string.")
             date_string = ''
 
-        # Parse the date string
-        date_obj = datetime.strptime(date_string, '%B %Y')
-
-        # Format the date as yyyy-mm-dd
-        paper_release_date = date_obj.strftime('%Y-%m-%d')
+        paper_release_date = release_date_from_text(date_string)
 
         return {"title": paper_title, "authors": paper_authors, "pdf_link": url, "topics": 'ScienceDirect', "release_date": paper_release_date}
+    except TimeoutException as e:
+        logging.error(f"[Science Direct] Timeout waiting for page to load: {e}")
+        return None
     except requests.exceptions.RequestException as e:
         logging.error(f"[Science Direct] Failed to fetch the paper details: {e}")
         return None
@@ -387,31 +594,63 @@ def get_paper_details_from_sciendirect(url: str):
         return None
 
 
-def get_paper_details_from_semanticscholar(url: str):
-    try:
-        driver = return_driver()
+async def get_paper_details_from_semanticscholar(url: str, session: aiohttp.ClientSession):
+    """
+    Read the details of a Semantic Scholar paper from the Graph API, a single JSON request instead of rendering its page.
+    Papers whose id cannot be read from the URL, or without a publication date in the API, are scraped from their page.
 
-        driver.get(url.replace('.pdf', ''))
-        WebDriverWait(driver, 10)
+    Parameters:
+    - url (str): The URL of the paper page.
+    - session (aiohttp.ClientSession): The shared session to query the API with.
 
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+    Returns:
+    - dict: The paper details.
+    - None: If there's an error during retrieval or parsing.
+    """
+    paper_id_match = SEMANTIC_SCHOLAR_PAPER_ID.search(url)
+    if paper_id_match:
+        # Send the API key configured in .env, if any. The calls stay within the unauthenticated rate of HOST_REQUESTS_PER_SECOND
+        headers = {'x-api-key': os.environ['SEMANTIC_SCHOLAR_API_KEY']} if os.getenv('SEMANTIC_SCHOLAR_API_KEY') else {}
+        try:
+            async with await get_with_retry(session, SEMANTIC_SCHOLAR_API_URL + paper_id_match.group(1), params={'fields': SEMANTIC_SCHOLAR_API_FIELDS}, headers=headers) as response:
+                response.raise_for_status()
+                paper = await response.json()
+            if paper.get('title') and paper.get('publicationDate'):
+                # Clean the author names as those read from the page
+                paper_authors = ', '.join(AUTHOR_NON_LETTERS.sub('', author['name'].replace('&', ',')).strip() for author in paper.get('authors') or [])
+                paper_authors = WHITESPACES.sub(' ', paper_authors)
+                return {"title": paper['title'], "authors": paper_authors, "pdf_link": url, "topics": 'SemanticScholar', "release_date": paper['publicationDate']}
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logging.warning(f"[Semantic Scholar] Failed to read {url} from the API, scraping its page. Error: {e}")
+    return await asyncio.to_thread(get_paper_details_from_semanticscholar_page, url)
+
+
+def get_paper_details_from_semanticscholar_page(url: str):
+    try:
+        with DRIVER_POOL.driver() as driver:
+            driver.get(url.replace('.pdf', ''))
+            WebDriverWait(driver, SELENIUM_WAIT_TIMEOUT).until(SEMANTIC_SCHOLAR_LOADED)
 
-        paper_title = soup.select_one('.fresh-paper-detail-page__header > h1:nth-child(2)').get_text()
+            soup = BeautifulSoup(driver.page_source, 'lxml')
+
+        paper_title = SEMANTIC_SCHOLAR_SELECTORS['title'].select_one(soup).get_text()
 
         # Select the .c-article-author-list element
-        author_list_text = soup.select_one('.author-list__link').get_text()
+        author_list_text = SEMANTIC_SCHOLAR_SELECTORS['author_list'].select_one(soup).get_text()
 
         # Remove non-alphabet characters, split the text by commas, and clean up spaces
-        paper_authors = ', '.join([re.sub(r'[^a-zA-Z, ]', '', author.replace('&', ',')).strip() for author in author_list_text.split(',')])
+        paper_authors = ', '.join([AUTHOR_NON_LETTERS.sub('', author.replace('&', ',')).strip() for author in author_list_text.split(',')])
 
-        paper_authors = re.sub(r'\s+', ' ', paper_authors)  # Replace multiple spaces with a single space
+        paper_authors = WHITESPACES.sub(' ', paper_authors)  # Replace multiple spaces with a single space
 
         # get published date
-        date_string = soup.select_one('li.paper-meta-item:nth-child(2) > span:nth-child(1) > span:nth-child(1) > span:nth-child(1) > span:nth-child(1)').get_text()
-        date_obj = datetime.strptime(date_string, '%d %B %Y')  # Parse the date string
-        paper_release_date = date_obj.strftime('%Y-%m-%d')  # Format the date as yyyy-mm-dd
+        date_string = SEMANTIC_SCHOLAR_SELECTORS['release_date'].select_one(soup).get_text()
+        paper_release_date = release_date_from_text(date_string)  # Format the date as yyyy-mm-dd
 
         return {"title": paper_title, "authors": paper_authors, "pdf_link": url, "topics": 'SemanticScholar', "release_date": paper_release_date}
+    except TimeoutException as e:
+        logging.error(f"[Semantic Scholar] Timeout waiting for page to load: {e}")
+        return None
     except requests.exceptions.RequestException as e:
         logging.error(f"[Semantics Scholar] Failed to fetch the paper details: {e}")
         return None
@@ -449,7 +688,8 @@ def main():
          {
              'name': 'arXiv',
              'link_file': 'arxiv_papers.csv',
-             'parsing_method': get_paper_details_from_arxiv
+             'parsing_method': get_paper_details_from_arxiv,
+             'prefetch_method': get_paper_details_from_arxiv_batch
          },
          {
              'name': 'SSRN',
@@ -469,7 +709,8 @@ def main():
          {
              'name': 'Research Gate',
              'link_file': 'researchgate_papers.csv',
-             'parsing_method': get_paper_details_from_research_gate
+             'parsing_method': get_paper_details_from_research_gate,
+             'max_concurrency': DRIVER_POOL_SIZE
          },
          {
              'name': 'DL-ACM',
@@ -479,23 +720,39 @@ def main():
         {
             'name': 'ScienceDirect',
             'link_file': 'sciencedirect_papers.csv',
-            'parsing_method': get_paper_details_from_sciendirect
+            'parsing_method': get_paper_details_from_sciendirect,
+            'max_concurrency': DRIVER_POOL_SIZE
         },
         {
             'name': 'SemanticScholar',
             'link_file': 'semanticscholar_papers.csv',
-            'parsing_method': get_paper_details_from_semanticscholar
+            'parsing_method': get_paper_details_from_semanticscholar,
+            'max_concurrency': DRIVER_POOL_SIZE
         },
     ]
 
+    # A paper listed in several link files, possibly with a different form of its URL, is only processed
+    # for the first site listing it
+    seen_links = set()
+    # Number of papers fetched concurrently for the sites not bounded by the driver pool, tunable from the environment
+    max_concurrent_papers = int(os.getenv('PAPER_DL_WORKERS', MAX_CONCURRENT_PAPERS))
     for site in paper_sites:
         link_file_path = os.path.join(root_data_directory, 'links', 'research_papers', site['link_file'])
-        links_and_referrers = read_csv_links_and_referrers(link_file_path)
-        download_and_save_paper(site['name'], links_and_referrers, csv_file, site['parsing_method'])
+        links_and_referrers = filter_seen_links(read_csv_links_and_referrers(link_file_path), seen_links)
+        prefetched_details = None
+        if 'prefetch_method' in site:
+            # Fetch the metadata of the whole site in bulk rather than one request per link,
+            # which needs the whole list of links rather than a stream
+            links_and_referrers = list(links_and_referrers)
+            prefetched_details = site['prefetch_method']([link.strip().replace('.pdf', '') for link, _ in links_and_referrers])
+        # Selenium parsers cannot run more pages at once than there are pooled drivers
+        max_concurrency = site.get('max_concurrency', max_concurrent_papers)
+        download_and_save_paper(site['name'], links_and_referrers, csv_file, site['parsing_method'], prefetched_details, max_concurrency)
+    save_pdf_validators()
     # OffHost
     parse_self_hosted_pdf()
     # Validate PDFs
-    validate_pdfs(os.path.join(root_data_directory, 'papers_pdf_downloads'))
+    validate_pdfs(papers_pdf_directory())
 
 
 if __name__ == "__main__":
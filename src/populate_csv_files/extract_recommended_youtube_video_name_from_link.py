@@ -5,10 +5,9 @@ import re
 import logging
 from datetime import datetime
 from dotenv import load_dotenv
-from googleapiclient.discovery import build
 from functools import partial
 
-from src.utils import root_directory, authenticate_service_account
+from src.utils import root_directory, authenticate_service_account, build_youtube_client, execute_request
 
 load_dotenv()
 
@@ -22,17 +21,11 @@ def extract_video_id_from_link(video_link):
 
 
 # Function to fetch video details by video link
-def get_video_details_by_link(credentials, api_key, video_link):
+def get_video_details_by_link(youtube, video_link):
     # Extract video ID from the video link
     video_id = extract_video_id_from_link(video_link)
 
     if video_id:
-        # Initialize the YouTube API client
-        if credentials is None:
-            youtube = build('youtube', 'v3', developerKey=api_key)
-        else:
-            youtube = build('youtube', 'v3', credentials=credentials, developerKey=api_key)
-
         # Request video details
         video_request = youtube.videos().list(
             part="snippet",
@@ -40,7 +33,7 @@ def get_video_details_by_link(credentials, api_key, video_link):
         )
 
         try:
-            video_response = video_request.execute()
+            video_response = execute_request(video_request)
             if video_response and 'items' in video_response:
                 video_info = video_response['items'][0]['snippet']
                 published_at = video_info['publishedAt']
@@ -59,10 +52,10 @@ def get_video_details_by_link(credentials, api_key, video_link):
 
 
 # Function to process a single row of the CSV and fetch video details
-def process_csv_row(row, credentials, api_key):
+def process_csv_row(row, youtube):
     video_link = row['video']
     referrer_link = row['referrer']
-    video_details = get_video_details_by_link(credentials, api_key, video_link)
+    video_details = get_video_details_by_link(youtube, video_link)
     if video_details:
         video_details['referrer'] = referrer_link
         video_details['link'] = video_link
@@ -92,7 +85,9 @@ def run():
         for row in csv_reader:
             video_channels.append(row)
 
-    process_csv_row_partial = partial(process_csv_row, credentials=credentials, api_key=api_key)
+    # Build the YouTube API client once, rows are processed in threads each executing on their own Http
+    youtube = build_youtube_client(credentials, api_key)
+    process_csv_row_partial = partial(process_csv_row, youtube=youtube)
 
     # Process video channels in parallel
     with concurrent.futures.ThreadPoolExecutor() as executor:
@@ -109,15 +104,14 @@ def run():
         writer = csv.DictWriter(csv_file, fieldnames=headers)
         writer.writeheader()  # Write the header
 
-        for video_details in video_details_list:
-            # Write video details to the CSV file
-            writer.writerow({
-                'title': video_details['title'],
-                'channel_name': video_details['channel_name'],
-                'Publish date': video_details['Publish date'],
-                'link': video_details['link'],
-                'referrer': video_details['referrer'],
-            })
+        # Write all video details to the CSV file in one call
+        writer.writerows({
+            'title': video_details['title'],
+            'channel_name': video_details['channel_name'],
+            'Publish date': video_details['Publish date'],
+            'link': video_details['link'],
+            'referrer': video_details['referrer'],
+        } for video_details in video_details_list)
 
     print(f"Results have been written to {output_csv_file_path}")
 
@@ -1,13 +1,11 @@
 import os
+import re
 import traceback
 from typing import List, Optional
 import json
 
-import aiohttp
 import pandas as pd
-from googleapiclient.discovery import build
 from dotenv import load_dotenv
-from google.oauth2.service_account import Credentials as ServiceAccountCredentials
 from datetime import datetime
 import logging
 import csv
@@ -15,41 +13,54 @@ import asyncio
 from aiohttp import ClientSession
 
 from src.populate_csv_files.constants import KEYWORDS_TO_INCLUDE, KEYWORDS_TO_EXCLUDE, YOUTUBE_VIDEOS_CSV_FILE_PATH, AUTHORS, FIRMS
-from src.utils import root_directory, authenticate_service_account, get_videos_from_playlist, get_channel_id, get_channel_name
+from src.utils import root_directory, authenticate_service_account, get_videos_from_playlist, get_channel_id, get_channel_name, make_aiohttp_session, build_youtube_client, execute_request, load_channel_ids, save_channel_ids, YOUTUBE_MAX_RESULTS_PER_PAGE
 
 # Load environment variables from the .env file
 load_dotenv()
 
+MAX_CONCURRENT_FETCHES = 8  # channels and playlists fetched concurrently, kept low to stay under YouTube QPS limits
 
-async def get_multiple_video_details(channel_name, youtube, video_ids, keywords, keywords_to_exclude, PASSTHROUGH):
+
+def compile_keywords_pattern(keywords: Optional[List[str]]) -> Optional[re.Pattern]:
+    """
+    Compile keywords into a single case-insensitive alternation, matching a title in one pass
+    instead of one lowercased substring search per keyword.
+
+    Returns None when there are no keywords, since an empty alternation would match every title.
+    """
+    if not keywords:
+        return None
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+
+async def get_multiple_video_details(channel_name, youtube, video_ids, keywords, keywords_to_exclude, PASSTHROUGH, existing_video_names):
     MAX_IDS_PER_REQUEST = 50  # YouTube API's limitation
     logging.info(f"[{channel_name}] Fetching video details for {len(video_ids)} videos...")
 
+    keywords_pattern = compile_keywords_pattern(keywords)
+    keywords_to_exclude_pattern = compile_keywords_pattern(keywords_to_exclude)
+
     # This function will handle the request and processing of each batch of video IDs
     async def process_id_batch(id_batch):
         try:
             id_list = ','.join(id_batch)
 
-            video_response = youtube.videos().list(
+            video_response = await asyncio.to_thread(execute_request, youtube.videos().list(
                 part="snippet",
                 id=id_list  # Pass a batch of video IDs here
-            ).execute()
+            ))
 
             items = video_response.get('items', [])
 
-            youtube_videos_df = pd.read_csv(YOUTUBE_VIDEOS_CSV_FILE_PATH, encoding='utf-8')
-            youtube_videos_df['title'] = youtube_videos_df['title'].str.replace(' +', ' ', regex=True)
-
             batch_video_details = []
 
             for item in items:
                 video_info_item = item['snippet']
                 video_title = video_info_item['title']
 
-                video_row = youtube_videos_df[youtube_videos_df['title'] == video_title]
-
-                def append_video_details(video_row, video_info_item, video_title, item):
-                    if not video_row.empty:
+                def append_video_details(video_info_item, video_title, item):
+                    # existing_video_names is loaded once per run and kept up to date as videos are saved
+                    if video_title in existing_video_names:
                         # print(f"Video {video_title} already exists in the CSV file. Skipping...")
                         return
 
@@ -64,12 +75,12 @@ async def get_multiple_video_details(channel_name, youtube, video_ids, keywords,
                     }
 
                 if video_info_item['channelTitle'] in PASSTHROUGH:
-                    video_detail = append_video_details(video_row, video_info_item, video_title, item)
+                    video_detail = append_video_details(video_info_item, video_title, item)
                     if video_detail:
                         batch_video_details.append(video_detail)
-                elif (not keywords or any(keyword.lower() in video_title.lower() for keyword in keywords)) \
-                        and not any(keyword.lower() in video_title.lower() for keyword in keywords_to_exclude):
-                    video_detail = append_video_details(video_row, video_info_item, video_title, item)
+                elif (keywords_pattern is None or keywords_pattern.search(video_title)) \
+                        and not (keywords_to_exclude_pattern and keywords_to_exclude_pattern.search(video_title)):
+                    video_detail = append_video_details(video_info_item, video_title, item)
                     if video_detail:
                         batch_video_details.append(video_detail)
 
@@ -90,33 +101,34 @@ async def get_multiple_video_details(channel_name, youtube, video_ids, keywords,
     return all_video_details
 
 
-async def get_video_info(session, credentials: ServiceAccountCredentials, api_key: str, channel_id: str, channel_name: str, PASSTHROUGH, max_results: int = 50) -> List[dict]:
+async def get_video_info(session, youtube, channel_id: str, channel_name: str, PASSTHROUGH, existing_video_names: set, channel_id_to_uploads_playlist_id: dict, max_results: int = 50) -> List[dict]:
     """
     Retrieves video information (URL, ID, title, and published date) from a YouTube channel using the YouTube Data API.
 
     Args:
-        api_key (str): Your YouTube Data API key.
+        youtube (Resource): The client returned by build_youtube_client.
         channel_id (str): The YouTube channel ID.
+        channel_id_to_uploads_playlist_id (dict): Cached "Uploads" playlist IDs, updated with the ones fetched.
         max_results (int, optional): Maximum number of results to retrieve. Defaults to 50.
 
     Returns:
         list: A list of dictionaries containing video URL, ID, title, and published date from the channel.
     """
-    # Initialize the YouTube API client
-    youtube = build('youtube', 'v3', credentials=credentials, developerKey=api_key)
-
-    # Get the "Uploads" playlist ID
-    channel_request = youtube.channels().list(
-        part="contentDetails",
-        id=channel_id,
-        fields="items/contentDetails/relatedPlaylists/uploads"
-    )
-    channel_response = channel_request.execute()
-    try:
-        uploads_playlist_id = channel_response["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
-    except Exception as e:
-        logging.error(f"Error occurred while fetching the uploads playlist ID. Error: {e}")
-        return []
+    # Get the "Uploads" playlist ID, which never changes for a given channel
+    uploads_playlist_id = channel_id_to_uploads_playlist_id.get(channel_id)
+    if uploads_playlist_id is None:
+        channel_request = youtube.channels().list(
+            part="contentDetails",
+            id=channel_id,
+            fields="items/contentDetails/relatedPlaylists/uploads"
+        )
+        channel_response = await asyncio.to_thread(execute_request, channel_request)
+        try:
+            uploads_playlist_id = channel_response["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
+        except Exception as e:
+            logging.error(f"Error occurred while fetching the uploads playlist ID. Error: {e}")
+            return []
+        channel_id_to_uploads_playlist_id[channel_id] = uploads_playlist_id  # Update the mapping
     # Fetch videos from the "Uploads" playlist
     video_info = []
     next_page_token = None
@@ -125,16 +137,16 @@ async def get_video_info(session, credentials: ServiceAccountCredentials, api_ke
         playlist_request = youtube.playlistItems().list(
             part="snippet",
             playlistId=uploads_playlist_id,
-            maxResults=max_results,
+            maxResults=min(max_results, YOUTUBE_MAX_RESULTS_PER_PAGE),
             pageToken=next_page_token,
         )
         try:
-            playlist_response = playlist_request.execute()
+            playlist_response = await asyncio.to_thread(execute_request, playlist_request)
         except Exception as e:
             logging.error(f"Error occurred while fetching videos from the channel. Error: {e}")
             return video_info
         video_ids = [item["snippet"]["resourceId"]["videoId"] for item in playlist_response.get('items', [])]
-        video_details = await get_multiple_video_details(channel_name, youtube, video_ids, KEYWORDS_TO_INCLUDE, KEYWORDS_TO_EXCLUDE, PASSTHROUGH)
+        video_details = await get_multiple_video_details(channel_name, youtube, video_ids, KEYWORDS_TO_INCLUDE, KEYWORDS_TO_EXCLUDE, PASSTHROUGH, existing_video_names)
 
         video_info.extend([video for video in video_details if video])  # Extend the list instead of overwriting it
 
@@ -159,11 +171,8 @@ def save_video_info_to_csv(video_info_list, csv_file_path, existing_video_names,
     except FileNotFoundError:
         existing_df = pd.DataFrame(columns=headers)
 
-    # Filter out existing video names
-    new_videos = [video for video in video_info_list if video['title'] not in existing_video_names]
-
     # Convert new video info list to DataFrame
-    new_df = pd.DataFrame(new_videos, columns=headers)
+    new_df = pd.DataFrame(video_info_list, columns=headers)
 
     # Concatenate new data with existing data
     combined_df = pd.concat([existing_df, new_df], ignore_index=True)
@@ -171,13 +180,16 @@ def save_video_info_to_csv(video_info_list, csv_file_path, existing_video_names,
     # Write the combined DataFrame to CSV
     combined_df.to_csv(csv_file_path, index=False, quoting=csv.QUOTE_MINIMAL)
 
+    # Keep the in-memory index in sync so that later channels skip these videos without re-reading the CSV
+    existing_video_names.update(video_info['title'] for video_info in video_info_list)
+
     # Log the added videos
     #for video in new_videos:
     #    logging.info(f"Added: {video}")
 
 
-async def fetch_and_save_channel_videos_async(session, channel_id, channel_name, credentials, api_key, csv_file_path, existing_video_names, headers, PASSTHROUGH):
-    video_info_list = await get_video_info(session, credentials, api_key, channel_id, channel_name, PASSTHROUGH)
+async def fetch_and_save_channel_videos_async(session, youtube, channel_id, channel_name, csv_file_path, existing_video_names, headers, PASSTHROUGH, channel_id_to_uploads_playlist_id):
+    video_info_list = await get_video_info(session, youtube, channel_id, channel_name, PASSTHROUGH, existing_video_names, channel_id_to_uploads_playlist_id)
 
     save_video_info_to_csv(video_info_list, csv_file_path, existing_video_names, headers)
     logging.info(f"[{channel_name}] Saved {len(video_info_list)} videos to CSV file {csv_file_path}.")
@@ -207,30 +219,38 @@ async def fetch_youtube_videos(api_key, yt_channels, yt_playlists, keywords, key
     else:
         logging.info("No service account file found. Proceeding with public channels or playlists.")
 
+    # Build the YouTube API client once and share it across channels and playlists
+    youtube = build_youtube_client(credentials, api_key)
+
     csv_file_exists, csv_file_path, headers = setup_csv()
 
     existing_data, existing_video_names, existing_channel_names = load_existing_data(csv_file_exists, csv_file_path)
 
-    channel_handle_to_name = get_channel_names(api_key, yt_channels)
+    channel_handle_to_name = get_channel_names(youtube, api_key, yt_channels)
 
     channels_in_csv, channels_not_in_csv = separate_channels_based_on_csv(channel_handle_to_name, existing_channel_names, yt_channels)
 
     if fetch_videos:
-        await fetch_channel_videos(api_key, channel_handle_to_name, channels_in_csv, channels_not_in_csv, credentials, csv_file_path, existing_video_names, headers, yt_channels, PASSTHROUGH)
-
-        await fetch_playlist_videos(api_key, credentials, csv_file_path, existing_video_names, headers, yt_playlists)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        await asyncio.gather(
+            fetch_channel_videos(youtube, api_key, channel_handle_to_name, channels_in_csv, channels_not_in_csv, csv_file_path, existing_video_names, headers, yt_channels, PASSTHROUGH, semaphore),
+            fetch_playlist_videos(youtube, csv_file_path, existing_video_names, headers, yt_playlists, semaphore),
+        )
 
     return existing_data
 
 
-async def fetch_playlist_videos(api_key, credentials, csv_file_path, existing_video_names, headers, yt_playlists):
+async def fetch_playlist_videos(youtube, csv_file_path, existing_video_names, headers, yt_playlists, semaphore):
+    async def fetch_playlist(playlist_id):
+        async with semaphore:
+            video_info_list = await asyncio.to_thread(get_videos_from_playlist, youtube, playlist_id)
+        save_video_info_to_csv(video_info_list, csv_file_path, existing_video_names, headers)
+
     if yt_playlists:
-        for playlist_id in yt_playlists:
-            video_info_list = get_videos_from_playlist(credentials, api_key, playlist_id)
-            save_video_info_to_csv(video_info_list, csv_file_path, existing_video_names, headers)
+        await asyncio.gather(*[fetch_playlist(playlist_id) for playlist_id in yt_playlists])
 
 
-async def fetch_channel_videos(api_key, channel_handle_to_name, channels_in_csv, channels_not_in_csv, credentials, csv_file_path, existing_video_names, headers, yt_channels, PASSTHROUGH):
+async def fetch_channel_videos(youtube, api_key, channel_handle_to_name, channels_in_csv, channels_not_in_csv, csv_file_path, existing_video_names, headers, yt_channels, PASSTHROUGH, semaphore):
     # Define the path for storing the mapping between channel names and their IDs
     channel_mapping_filepath = f"{root_directory()}/data/links/channel_handle_to_id_mapping.json"
 
@@ -245,22 +265,30 @@ async def fetch_channel_videos(api_key, channel_handle_to_name, channels_in_csv,
         with open(channel_mapping_filepath, 'w', encoding='utf-8') as file:
             json.dump(channel_name_to_id, file, ensure_ascii=False, indent=4)
 
-    async with aiohttp.ClientSession() as session:
-        # This part of the logic is kept as originally intended, processing the channels based on whether they are in the CSV or not
-        all_channels = set(channels_in_csv + channels_not_in_csv)  # Avoid duplicate channel processing
-        for channel_handle in all_channels:
-            channel_name = channel_handle_to_name.get(channel_handle)
-            if channel_name:
+    # Load the mapping between channel IDs and their "Uploads" playlist IDs
+    uploads_mapping_filepath = f"{root_directory()}/data/links/channel_id_to_uploads_playlist_id_mapping.json"
+    channel_id_to_uploads_playlist_id = load_channel_ids(uploads_mapping_filepath)
+
+    async def fetch_channel(session, channel_handle):
+        channel_name = channel_handle_to_name.get(channel_handle)
+        if channel_name:
+            async with semaphore:
                 # Retrieve the channel ID, either from the mapping or by requesting it
                 channel_id = await get_channel_id(session, api_key, channel_handle, channel_name_to_id)
                 if channel_id:
                     # Your existing method to fetch and save videos
-                    # session, channel_id, channel_name, credentials, api_key, csv_file_path, existing_video_names, headers
-                    await fetch_and_save_channel_videos_async(session, channel_id, channel_name, credentials, api_key, csv_file_path, existing_video_names, headers, PASSTHROUGH)
+                    # session, youtube, channel_id, channel_name, csv_file_path, existing_video_names, headers
+                    await fetch_and_save_channel_videos_async(session, youtube, channel_id, channel_name, csv_file_path, existing_video_names, headers, PASSTHROUGH, channel_id_to_uploads_playlist_id)
 
-    # After processing all channels, save the potentially updated mapping back to the file
+    async with make_aiohttp_session() as session:
+        # This part of the logic is kept as originally intended, processing the channels based on whether they are in the CSV or not
+        all_channels = set(channels_in_csv + channels_not_in_csv)  # Avoid duplicate channel processing
+        await asyncio.gather(*[fetch_channel(session, channel_handle) for channel_handle in all_channels])
+
+    # After processing all channels, save the potentially updated mappings back to the files
     with open(channel_mapping_filepath, 'w', encoding='utf-8') as file:
         json.dump(channel_name_to_id, file, ensure_ascii=False, indent=4)
+    save_channel_ids(uploads_mapping_filepath, channel_id_to_uploads_playlist_id)
 
 
 def separate_channels_based_on_csv(channel_handle_to_name, existing_channel_names, yt_channels):
@@ -278,7 +306,7 @@ def separate_channels_based_on_csv(channel_handle_to_name, existing_channel_name
     return channels_in_csv, channels_not_in_csv
 
 
-def get_channel_names(api_key, yt_channels):
+def get_channel_names(youtube, api_key, yt_channels):
     mapping_filepath = os.path.join(root_directory(), "data/links/channel_handle_to_name_mapping.json")
 
     # Check if mapping file exists, if so, load it
@@ -292,7 +320,7 @@ def get_channel_names(api_key, yt_channels):
     missing_handles = [handle for handle in yt_channels if handle not in channel_handle_to_name]
 
     for channel_handle in missing_handles:
-        channel_name = get_channel_name(api_key, channel_handle)
+        channel_name = get_channel_name(youtube, api_key, channel_handle)
         if channel_name:
             # Check if the channel name starts with "=" and wrap it in triple quotes if so
             if channel_name.startswith("="):
@@ -372,40 +400,26 @@ def filter_and_remove_videos(input_csv_path, keywords, keywords_to_exclude, PASS
         channel_specific_filters = {}
     df = pd.read_csv(input_csv_path)
 
-    # Separate rows corresponding to channels in PASSTHROUGH
-    passthrough_df = df[df['channel_name'].str.lower().isin([channel.lower() for channel in PASSTHROUGH])]
-    non_passthrough_df = df[~df['channel_name'].str.lower().isin([channel.lower() for channel in PASSTHROUGH])]
-
-    # Apply global keyword filtering only to non-PASSTHROUGH channels
-    global_filtered_df = non_passthrough_df[non_passthrough_df['title'].str.lower().str.contains('|'.join(keywords).lower(), na=False)]
-
-    # Filter out titles from passthrough_df that contain any of the keywords_to_exclude
-    passthrough_df = passthrough_df[~passthrough_df['title'].str.lower().str.contains('|'.join(keywords_to_exclude).lower(), na=False)]
-
-    # Concatenate PASSTHROUGH and non-PASSTHROUGH videos
-    global_filtered_df = pd.concat([global_filtered_df, passthrough_df])
-
-    # Convert keys in channel_specific_filters to lowercase
-    channel_specific_filters = {channel.lower(): filters for channel, filters in channel_specific_filters.items()}
-
-    # Initialize DataFrame for final filtered videos
-    final_filtered_df = pd.DataFrame()
+    # Lowercase the columns once and build a single keep mask, instead of partitioning and concatenating DataFrames
+    channel_names = df['channel_name'].str.lower()
+    titles = df['title'].str.lower()
 
-    # Identify the channels in the DataFrame that have channel-specific filters
-    channels_with_specific_filters = set(global_filtered_df['channel_name'].str.lower()) & set(channel_specific_filters.keys())
+    # Apply global keyword filtering only to non-PASSTHROUGH channels,
+    # and filter out titles from PASSTHROUGH channels that contain any of the keywords_to_exclude
+    is_passthrough = channel_names.isin([channel.lower() for channel in PASSTHROUGH])
+    matches_keywords = titles.str.contains('|'.join(keywords).lower(), na=False)
+    matches_keywords_to_exclude = titles.str.contains('|'.join(keywords_to_exclude).lower(), na=False)
+    keep = (~is_passthrough & matches_keywords) | (is_passthrough & ~matches_keywords_to_exclude)
 
-    # Apply channel-specific keyword filtering to the channels identified
-    for channel in channels_with_specific_filters:
-        channel_keywords = channel_specific_filters[channel]
-        channel_df = global_filtered_df[global_filtered_df['channel_name'].str.lower() == channel]
-        channel_filtered_df = channel_df[channel_df['title'].str.lower().str.contains('|'.join(channel_keywords).lower(), na=False)]
-        final_filtered_df = pd.concat([final_filtered_df, channel_filtered_df])
+    # Apply channel-specific keyword filtering to the channels which have channel-specific filters
+    for channel, channel_keywords in channel_specific_filters.items():
+        is_channel = channel_names == channel.lower()
+        keep &= ~is_channel | titles.str.contains('|'.join(channel_keywords).lower(), na=False)
 
-    # Concatenate videos from channels that did not have channel-specific filters
-    final_filtered_df = pd.concat([final_filtered_df, global_filtered_df[~global_filtered_df['channel_name'].str.lower().isin(channels_with_specific_filters)]])
+    final_filtered_df = df[keep]
 
     # Identify removed videos
-    removed_df = df[~df['title'].isin(final_filtered_df['title'])]
+    removed_df = df[~keep]
 
     # Log the removed video titles
     for _, removed_video in removed_df.iterrows():
@@ -8,7 +8,7 @@ import logging
 from urllib.parse import urlparse, urljoin
 from typing import Dict, Set
 
-from src.utils import root_directory
+from src.utils import root_directory, get_session
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -50,7 +50,7 @@ def fetch_article_urls(url: str, selectors: Dict[str, str]) -> Set[str]:
     """
     base_url = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
     try:
-        response = requests.get(url)
+        response = get_session().get(url, timeout=30)
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         logging.error(f"Failed to fetch the webpage: {e}")
@@ -107,7 +107,7 @@ def get_article_urls(config: Dict[str, Dict[str, str]]) -> Dict[str, Set[str]]:
                     logging.warning("No articles found or unable to fetch the page.")
 
                 try:
-                    response = requests.get(current_page_url)
+                    response = get_session().get(current_page_url, timeout=30)
                     soup = BeautifulSoup(response.content, 'html.parser')
                     next_page_link = soup.select_one(selectors.get('next_page_selector', ''))
                     if next_page_link and 'href' in next_page_link.attrs:
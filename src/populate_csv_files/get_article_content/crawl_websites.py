@@ -3,11 +3,10 @@ import logging
 import time
 import re
 from concurrent.futures import ThreadPoolExecutor
-import requests
 from bs4 import BeautifulSoup
 
 from data.links.website_to_crawl_configs import sites_config
-from src.utils import root_directory, return_driver
+from src.utils import root_directory, return_driver, get_session
 
 logging.basicConfig(level=logging.INFO, filename='scraping_log.log', filemode='a',
                     format='%(asctime)s - %(levelname)s - %(message)s')
@@ -34,7 +33,7 @@ def parse_site(site_name, site):
         content = driver.page_source
         driver.quit()  # Ensures the driver closes properly
     else:
-        response = requests.get(site["table_page_url"])
+        response = get_session().get(site["table_page_url"], timeout=30)
         if response.status_code != 200:
             logging.error(f"Failed to fetch {site_name}: HTTP {response.status_code}")
             return
@@ -11,7 +11,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from src.populate_csv_files.get_article_content.utils import html_to_markdown_docs_chainlink, html_to_markdown_docs, markdown_to_html
-from src.utils import root_directory, return_driver
+from src.utils import root_directory, return_driver, get_session
 
 import pandas as pd
 from pathlib import Path
@@ -271,7 +271,7 @@ def embed_images_as_data_urls(soup, base_url, img_selector):
         if src:
             img_url = urljoin(base_url, src)
             try:
-                response = requests.get(img_url, timeout=10)
+                response = get_session().get(img_url, timeout=10)
                 if response.status_code == 200:
                     img_type = response.headers['Content-Type'].split('/')[-1]  # More accurate MIME type
                     img_data = base64.b64encode(response.content).decode('utf-8')
@@ -282,7 +282,7 @@ def embed_images_as_data_urls(soup, base_url, img_selector):
 
 def fetch_page(url):
     try:
-        response = requests.get(url, timeout=10)  # Added timeout for robustness
+        response = get_session().get(url, timeout=10)  # Added timeout for robustness
         return response.text if response.status_code == 200 else None
     except requests.RequestException as e:
         logging.error(f"Error fetching {url}: {e}")
@@ -3,6 +3,8 @@ from bs4 import BeautifulSoup
 import csv
 import logging
 
+from src.utils import get_session
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -11,15 +13,14 @@ def resolve_url(short_url):
     """
     Resolve the shortened URL to its final destination.
     """
-    # Use a session to reuse the TCP connection
-    with requests.Session() as session:
-        try:
-            # HEAD request to avoid downloading the content
-            response = session.head(short_url, allow_redirects=True, timeout=10)
-            return response.url
-        except requests.RequestException as e:
-            logging.error("Failed to resolve URL %s: %s", short_url, e)
-            return short_url  # Return the original URL if unable to resolve
+    # Use the shared session to reuse the TCP connection across URLs
+    try:
+        # HEAD request to avoid downloading the content
+        response = get_session().head(short_url, allow_redirects=True, timeout=10)
+        return response.url
+    except requests.RequestException as e:
+        logging.error("Failed to resolve URL %s: %s", short_url, e)
+        return short_url  # Return the original URL if unable to resolve
 
 
 def scrape_prizes():
@@ -29,7 +30,7 @@ def scrape_prizes():
     url = 'https://ethglobal.com/events/london2024/prizes'
 
     # Send a GET request
-    response = requests.get(url)
+    response = get_session().get(url, timeout=30)
     if response.status_code != 200:
         logging.error("Failed to fetch the webpage. Status code: %s", response.status_code)
         return
@@ -110,8 +110,7 @@ def scrape_forum_links(base_url, csv_name):
     with open(csv_path, 'w', newline='', encoding='utf-8') as file:
         writer = csv.writer(file)
         writer.writerow(['Link', 'Author', 'Release Date', 'Title'])
-        for row in data:
-            writer.writerow(row)
+        writer.writerows(data)
 
     logging.info(f"Total {len(data)} new records have been extracted and saved to CSV for {csv_name}.")
     logging.info("Scraping completed for " + base_url)
@@ -4,7 +4,7 @@ import pdfkit
 import logging
 import time
 from markdown import markdown
-from src.utils import root_directory
+from src.utils import root_directory, get_session
 import dotenv
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from weasyprint import HTML
@@ -19,7 +19,7 @@ assert GITHUB_TOKEN is not None, "GITHUB_TOKEN environment variable is not set"
 
 def get_content_list(github_api_url, headers, retry_count=3, delay=5):
     try:
-        response = requests.get(github_api_url, headers=headers)
+        response = get_session().get(github_api_url, headers=headers, timeout=30)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.HTTPError as e:
@@ -104,7 +104,7 @@ def process_file(output_dir, file_info, headers, overwrite):
 
     try:
         file_url = file_info['download_url']
-        file_content = requests.get(file_url, headers=headers).text
+        file_content = get_session().get(file_url, headers=headers, timeout=30).text
         convert_to_pdf_with_fallback(file_content, output_pdf_path)
         logging.info(f"Successfully processed and saved: {output_pdf_path}")
     except Exception as e:
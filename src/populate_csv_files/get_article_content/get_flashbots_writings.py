@@ -1,5 +1,4 @@
 import pandas as pd
-import requests
 import os
 import pdfkit
 import logging
@@ -7,7 +6,7 @@ from concurrent.futures import ThreadPoolExecutor
 import yaml
 import markdown
 
-from src.utils import root_directory
+from src.utils import root_directory, get_session
 from datetime import datetime
 from src.populate_csv_files.get_article_content.utils import markdown_to_html, sanitize_filename
 
@@ -15,7 +14,7 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 
 
 def get_file_list(GITHUB_API_URL="https://api.github.com/repos/flashbots/flashbots-writings-website/contents/content"):
-    response = requests.get(GITHUB_API_URL)
+    response = get_session().get(GITHUB_API_URL, timeout=30)
     if response.status_code == 200:
         return response.json()
     else:
@@ -75,7 +74,7 @@ def convert_mdx_to_pdf(mdx_content, output_pdf_path):
 def process_file_info(output_dir, file_info):
     if file_info['name'].endswith('.mdx'):
         mdx_url = file_info['download_url']
-        mdx_content = requests.get(mdx_url).text
+        mdx_content = get_session().get(mdx_url, timeout=30).text
         default_title = os.path.splitext(file_info['name'])[0]
         title = extract_title_from_mdx(mdx_content, default_title)
         authors = extract_authors_from_mdx(mdx_content)
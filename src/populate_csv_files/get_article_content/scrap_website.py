@@ -5,11 +5,10 @@ import re
 import time
 from urllib.parse import urlparse
 
-import requests
 from bs4 import BeautifulSoup, NavigableString, Tag
 
 from src.populate_csv_files.get_article_content.utils import safe_request, html_to_markdown, sanitize_mojibake, convert_date_format, convert_mirror_date_format, convert_frontier_tech_date_format, html_to_markdown_a16z
-from src.utils import return_driver
+from src.utils import return_driver, get_session
 
 empty_content = {
         'content': None,
@@ -22,7 +21,7 @@ empty_content = {
 
 
 def get_file_list(GITHUB_API_URL="https://api.github.com/repos/flashbots/flashbots-writings-website/contents/content"):
-    response = requests.get(GITHUB_API_URL)
+    response = get_session().get(GITHUB_API_URL, timeout=30)
     if response.status_code == 200:
         return response.json()  # Returns a list of file information
     else:
@@ -98,11 +97,11 @@ def fetch_medium_content_from_url(url):
             logging.info(f"URL {url} is a user name, skipping")
             return empty_content
 
-        response = requests.get(url)
+        response = get_session().get(url, timeout=30)
         # check if response is 404 and if it is try removing the part of the url that contains `@<username>/` namely for this example 'https://medium.com/@bloqarl/rektoff/a-security-system-starts-with-the-testing-how-to-properly-battle-test-your-smart-contracts-4dd3a7538959' return 'https://medium.com/rektoff/a-security-system-starts-with-the-testing-how-to-properly-battle-test-your-smart-contracts-4dd3a7538959'
         if response.status_code == 404:
             url = url.replace(url.split('/')[3] + '/', '')
-            response = requests.get(url)
+            response = get_session().get(url, timeout=30)
         response.encoding = 'utf-8'
         content = response.text
 
@@ -169,7 +168,7 @@ def fetch_medium_content_from_url(url):
 
 def fetch_mirror_content_from_url(url):
     try:
-        response = requests.get(url)
+        response = get_session().get(url, timeout=30)
         response.raise_for_status()  # This will raise an HTTPError if the HTTP request returned an unsuccessful status code
         content = response.text
 
@@ -237,7 +236,7 @@ def fetch_mirror_content_from_url(url):
 
 def fetch_frontier_tech_content_from_url(url):
     try:
-        response = requests.get(url)
+        response = get_session().get(url, timeout=30)
         response.encoding = 'utf-8'
         content = response.text
 
@@ -502,7 +501,7 @@ def fetch_hackmd_article_content(url):
     - str: The title of the article, or None if the title could not be fetched.
     """
     try:
-        response = requests.get(url)
+        response = get_session().get(url, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -535,7 +534,7 @@ def fetch_hackmd_article_content(url):
 def fetch_vitalik_ca_article_content(url):
     title = None
     try:
-        response = requests.get(url)
+        response = get_session().get(url, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
         title_element = soup.find('link', {'rel': 'alternate', 'type': 'application/rss+xml'})
@@ -549,7 +548,7 @@ def fetch_vitalik_ca_article_content(url):
 
 def fetch_paradigm_article_content(url):
     try:
-        response = requests.get(url)
+        response = get_session().get(url, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -609,7 +608,7 @@ def fetch_propellerheads_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -657,7 +656,7 @@ def fetch_propellerheads_article_content(url):
 
 def fetch_jump_article_content(url):
     try:
-        response = requests.get(url)
+        response = get_session().get(url, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -705,7 +704,7 @@ def fetch_jump_article_content(url):
 
 def fetch_a16z_article_content(url):
     try:
-        response = requests.get(url)
+        response = get_session().get(url, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -776,7 +775,7 @@ def fetch_dba_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -855,7 +854,7 @@ def fetch_iex_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -916,7 +915,7 @@ def fetch_uniswap_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -970,7 +969,7 @@ def fetch_substack_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1027,7 +1026,7 @@ def fetch_vitalik_article_content(url):
     - dict: A dictionary with title, content, release date, and author of the article.
     """
     try:
-        response = requests.get(url)
+        response = get_session().get(url, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1078,7 +1077,7 @@ def fetch_monoceros_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1125,7 +1124,7 @@ def fetch_helius_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1180,7 +1179,7 @@ def fetch_mevio_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1235,7 +1234,7 @@ def fetch_outlierventures_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1291,7 +1290,7 @@ def fetch_gauntlet_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1347,7 +1346,7 @@ def fetch_chainlink_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1403,7 +1402,7 @@ def fetch_blocknative_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1463,7 +1462,7 @@ def fetch_shutter_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1520,7 +1519,7 @@ def fetch_duality_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1578,7 +1577,7 @@ def fetch_dydx_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1635,7 +1634,7 @@ def fetch_merkle_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1692,7 +1691,7 @@ def fetch_openzeppelin_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1750,7 +1749,7 @@ def fetch_zaryabs_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1804,7 +1803,7 @@ def fetch_cyfrin_article_content(url):
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1861,7 +1860,7 @@ def fetch_nil_foundation_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1911,7 +1910,7 @@ def fetch_quillaudits_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -1961,7 +1960,7 @@ def fetch_paragraph_xyz_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -2012,7 +2011,7 @@ def fetch_brink_article_content(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
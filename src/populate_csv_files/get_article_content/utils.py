@@ -7,7 +7,7 @@ import requests
 from datetime import datetime
 from urllib.parse import urlparse, urljoin
 
-from src.utils import root_directory, return_driver
+from src.utils import root_directory, return_driver, get_session
 from bs4 import NavigableString
 
 
@@ -25,7 +25,7 @@ def safe_request(url, max_retries=10, backoff_factor=1):
     """
     for attempt in range(max_retries):
         try:
-            response = requests.get(url)
+            response = get_session().get(url, timeout=30)
             response.raise_for_status()
             return response
         except requests.exceptions.HTTPError as e:
@@ -1,4 +1,3 @@
-import csv
 import logging
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -10,7 +9,7 @@ from selenium import webdriver
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
 from src.populate_csv_files.get_docs.docs import start_urls
-from src.utils import return_driver, root_directory
+from src.utils import return_driver, root_directory, CsvAppender
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -45,26 +44,19 @@ def get_all_website_links_selenium(url, driver):
             urls.add(full_url)
     return urls
 
-def save_urls(urls, filename):
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
-    with open(filename, 'a', newline='', encoding='utf-8') as csvfile:  # Open in append mode
-        fieldnames = ['URL']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        if os.stat(filename).st_size == 0:  # Write header only if file is empty
-            writer.writeheader()
-        for url in urls:
-            writer.writerow({'URL': url})
-
 def crawl_website_selenium(start_url, intermediate_save_interval=20):
     driver = return_driver()
     visited_urls = set()
     urls_to_visit = get_all_website_links_selenium(start_url, driver)
-    count = 0
 
     data_dir = os.path.join(root_directory(), "data", "docs")
     base_name = urlparse(start_url).netloc.replace('.', '_') + urlparse(start_url).path.replace('/', '_').rstrip('_')
     filename = os.path.join(data_dir, f"{base_name}.csv")
+    os.makedirs(data_dir, exist_ok=True)
 
+    # Visited URLs are appended through one file handle, flushed every intermediate_save_interval URLs
+    # rather than reopening the file for each intermediate save
+    appender = CsvAppender(filename, ['URL'], flush_every=intermediate_save_interval)
     try:
         while urls_to_visit:
             current_url = urls_to_visit.pop()
@@ -72,19 +64,14 @@ def crawl_website_selenium(start_url, intermediate_save_interval=20):
                 continue
             logging.info(f"Visiting: {current_url}")
             visited_urls.add(current_url)
+            appender.write({'URL': current_url})
             new_urls = get_all_website_links_selenium(current_url, driver)
-            urls_to_visit = urls_to_visit.union(new_urls)
-
-            # Intermediate save
-            if count % intermediate_save_interval == 0 and count > 0:
-                save_urls(visited_urls, filename)
-                visited_urls.clear()  # Clear visited after saving to manage memory
-            count += 1
+            urls_to_visit.update(new_urls - visited_urls)
 
     except WebDriverException as e:
         logging.error(f"WebDriver exception for {start_url}: {e}")
     finally:
-        save_urls(visited_urls, filename)  # Final save
+        appender.close()  # Final save
         driver.quit()  # Ensure the driver quits even if an error occurs
 
 def crawl_websites_in_parallel(start_urls):
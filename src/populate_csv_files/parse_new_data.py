@@ -5,7 +5,7 @@ import pandas as pd
 from urllib.parse import urlparse
 import re
 
-from src.utils import root_directory, ensure_newline_in_csv
+from src.utils import root_directory
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -167,11 +167,14 @@ def parse_and_categorize_links(input_filepath: str, domains_filepath: str, resea
     paths_and_dfs.update({f"{site}_papers.csv": (rdf, research_columns) for site, rdf in research_dfs.items()})
 
     # Step 1: Loading existing data
+    # Each existing CSV is read once, its DataFrame is reused when merging the new data below
+    existing_dfs = {}
     existing_data = {}
     for filename, (_, columns) in paths_and_dfs.items():
         filepath = os.path.join(output_dir, filename)
         if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
-            existing_data[filepath] = set(pd.read_csv(filepath)[columns[0]])
+            existing_dfs[filepath] = pd.read_csv(filepath)
+            existing_data[filepath] = set(existing_dfs[filepath][columns[0]])
 
     # Step 2: Updating masks
     existing_in_csv_mask = pd.Series([False] * len(df))
@@ -181,16 +184,8 @@ def parse_and_categorize_links(input_filepath: str, domains_filepath: str, resea
             if filepath in existing_data:
                 existing_in_csv_mask |= df['content'].isin(existing_data[filepath])
 
-                filepath = os.path.join(output_dir, filename)
-
-                # Ensure CSV ends with a newline
-                ensure_newline_in_csv(filepath)
-
-                # Read the existing data
-                if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
-                    existing_df = pd.read_csv(filepath)
-                else:
-                    existing_df = pd.DataFrame(columns=columns)  # Add default columns based on the file being processed
+                # The CSV is rewritten whole below, it needs no trailing newline check
+                existing_df = existing_dfs[filepath]
 
                 # Make new_df have the exact same columns as existing_df, in the same order
                 # new_df = new_df.reindex(columns=existing_df.columns)
@@ -8,7 +8,7 @@ import numpy as np
 import pandas as pd
 from PyPDF2 import PdfReader
 import requests
-from io import BytesIO
+from tempfile import SpooledTemporaryFile
 from concurrent.futures import ThreadPoolExecutor
 import fitz  # PyMuPDF
 from pdfminer.pdfparser import PDFParser
@@ -16,7 +16,10 @@ from pdfminer.pdfdocument import PDFDocument
 import pikepdf
 
 from src.populate_csv_files.get_article_content.get_article_content import update_csv
-from src.utils import root_directory, download_pdf
+from src.utils import root_directory, download_pdf, save_pdf_validators, get_session, papers_pdf_directory, PDF_CHUNK_SIZE
+
+MAX_DOWNLOAD_WORKERS = 32  # PDF fetches are network-bound, use more threads than the default min(32, cpu_count + 4)
+PDF_SPOOL_MAX_SIZE = 1 << 24  # bytes of a fetched PDF kept in memory before spilling it to a temporary file
 
 
 def load_failed_urls():
@@ -40,15 +43,12 @@ def download_self_hosted_pdfs(df, url, paper_title):
         paper_title_from_df = paper_title_row['title'].iloc[0] if not paper_title_row.empty else str(urlparse(url).path.split('/')[-1]).replace('.pdf', '').replace('%20', ' ')
         paper_title = paper_title_from_df
 
-    pdf_directory = os.path.join(root_directory(), 'data', 'papers_pdf_downloads')
+    pdf_directory = papers_pdf_directory()
     pdf_filename = f"{paper_title.replace('/', '<slash>').replace('.pdf', '').replace('docx', '').replace('Microsoft Word - ', '')}"
     pdf_path = os.path.join(pdf_directory, f"{pdf_filename}.pdf")
 
     # Download the paper if it doesn't exist locally
-    pdf_content = download_pdf(f"{url}", url)
-    if pdf_content:
-        with open(pdf_path, "wb") as f:
-            f.write(pdf_content)
+    if download_pdf(f"{url}", url, pdf_path):
         logging.info(f"[Self-host] Successfully downloaded [{paper_title}]")
     else:
         logging.warning(f"[Self-host] Failed to download a valid PDF file from {url}")
@@ -58,12 +58,15 @@ def download_self_hosted_pdfs(df, url, paper_title):
 def get_pdf_details(url, df):
     paper_title = None
     try:
-        # Attempt to download the PDF content
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
+        # Attempt to download the PDF content, streamed to a file kept in memory up to PDF_SPOOL_MAX_SIZE and
+        # spilled to disk beyond, rather than holding the whole response body and a copy of it in memory
+        with get_session().get(url, timeout=30, stream=True) as response, SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_SIZE) as f:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=PDF_CHUNK_SIZE):
+                f.write(chunk)
+            f.seek(0)
 
-        # Step 5: Using PyPDF2 to get the PDF details
-        with BytesIO(response.content) as f:
+            # Step 5: Using PyPDF2 to get the PDF details
             reader = PdfReader(f)
             info = reader.metadata
 
@@ -169,8 +172,10 @@ def parse_self_hosted_pdf(overwrite=False):
 
     get_pdf_details_partial = partial(get_pdf_details, df=existing_df)
 
-    with ThreadPoolExecutor() as executor:
+    with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(df))) as executor:
         df['paper_details'] = list(executor.map(get_pdf_details_partial, df['paper']))
+    # Persist the PDF validators so that the next run issues conditional requests
+    save_pdf_validators()
 
     # Add the referrer series to the DataFrame
     df['referrer'] = referrer_series
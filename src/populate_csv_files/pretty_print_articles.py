@@ -4,8 +4,7 @@ import logging
 
 import pandas as pd
 from bs4 import BeautifulSoup
-import requests
-from src.utils import root_directory, return_driver
+from src.utils import root_directory, return_driver, get_session
 from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 
@@ -22,7 +21,7 @@ def fetch_title_from_url(url, css_selector):
     - str: The title of the article, or None if the title could not be fetched.
     """
     try:
-        response = requests.get(url)
+        response = get_session().get(url, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
         title = soup.select_one(css_selector).text.strip()
@@ -124,7 +123,7 @@ def fetch_hackmd_titles(url):
     """
     title = None
     try:
-        response = requests.get(url)
+        response = get_session().get(url, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
         title_element = soup.find('title')
@@ -142,7 +141,7 @@ def fetch_hackmd_titles(url):
 def fetch_medium_titles(url):
     title = None
     try:
-        response = requests.get(url)
+        response = get_session().get(url, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
         title_element = soup.find('title', {'data-rh': "true"})
@@ -160,7 +159,7 @@ def fetch_medium_titles(url):
 def fetch_vitalik_ca_titles(url):
     title = None
     try:
-        response = requests.get(url)
+        response = get_session().get(url, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
         title_element = soup.find('link', {'rel': 'alternate', 'type': 'application/rss+xml'})
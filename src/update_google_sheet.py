@@ -10,10 +10,9 @@ import logging
 import re
 
 from bs4 import BeautifulSoup
-import requests
 from concurrent.futures import ThreadPoolExecutor
 
-from src.utils import root_directory
+from src.utils import root_directory, get_session
 
 load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -36,8 +35,8 @@ def create_hyperlink_formula(value):
 
 def get_title_from_url(url):
     try:
-        response = requests.get(url)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = get_session().get(url, timeout=30)
+        soup = BeautifulSoup(response.text, 'lxml')
         title = soup.title.string
         return title
     except Exception as e:
@@ -55,6 +54,8 @@ class GoogleSheetUpdater:
             'https://www.googleapis.com/auth/drive'
         ])
         self.client = gspread.authorize(self.credentials)
+        # Built once per updater rather than once per formatted tab
+        self.service = build('sheets', 'v4', credentials=self.credentials)
 
     def create_or_get_worksheet(self, tab_name, num_rows, num_cols):
         try:
@@ -117,8 +118,6 @@ class GoogleSheetUpdater:
 
         set_with_dataframe(sheet, df, row=1, col=1, include_index=False, resize=True)
 
-        service = build('sheets', 'v4', credentials=self.credentials)
-
         requests = [
             # Bold formatting request for header
             {
@@ -218,12 +217,6 @@ class GoogleSheetUpdater:
         # Append the filter request to the existing list of requests
         requests.append(filter_request)
 
-        body = {
-            'requests': requests
-        }
-
-        service.spreadsheets().batchUpdate(spreadsheetId=self.sheet_id, body=body).execute()
-
         num_columns = df.shape[1]
         # Identify columns that should not be auto-resized fully
         # For example, excluding "Pdf link" and "Authors"
@@ -267,9 +260,9 @@ class GoogleSheetUpdater:
         # Assuming `requests` is your list of other formatting requests
         requests += resize_requests
 
-        # Execute all requests in a batchUpdate call
+        # Execute all requests in a single batchUpdate call
         body = {"requests": requests}
-        service.spreadsheets().batchUpdate(spreadsheetId=self.sheet_id, body=body).execute()
+        self.service.spreadsheets().batchUpdate(spreadsheetId=self.sheet_id, body=body).execute()
         logging.info(f"Saved data to new tab '{tab_name}' in Google Sheet and added filters.")
 
     def update_google_sheet(self, data, tab_name, num_rows, num_cols):
@@ -322,14 +315,11 @@ class GoogleSheetUpdater:
 
         df['Referrer'] = df['Referrer'].apply(create_hyperlink_formula)
 
-        # Clear the sheet before inserting new data
-        sheet.clear()
-
-        # Use gspread's `set_dataframe` to upload the whole DataFrame at once
+        # Use gspread's `set_dataframe` to upload the whole DataFrame at once. Resizing the sheet to the
+        # DataFrame drops any stale rows and columns, so the sheet does not need to be cleared first.
         gspread_dataframe.set_with_dataframe(sheet, df, row=1, col=1, include_index=False, resize=True)
 
         # Set up filters, format header row in bold, and freeze the header using Google Sheets API
-        service = build('sheets', 'v4', credentials=self.credentials)
 
         if df.shape[0] > 0:
             # Prepare the requests for bold formatting, center-align header, left-align content, and freezing header
@@ -460,7 +450,7 @@ class GoogleSheetUpdater:
                 'requests': requests
             }
 
-            service.spreadsheets().batchUpdate(spreadsheetId=os.getenv("GOOGLE_SHEET_ID"), body=body).execute()
+            self.service.spreadsheets().batchUpdate(spreadsheetId=os.getenv("GOOGLE_SHEET_ID"), body=body).execute()
 
         logging.info("Saved CSV data to Google Sheet, formatted header, and added filters.")
 
@@ -468,8 +458,7 @@ class GoogleSheetUpdater:
         body = {
             'requests': requests
         }
-        service = build('sheets', 'v4', credentials=self.credentials)
-        service.spreadsheets().batchUpdate(spreadsheetId=self.sheet_id, body=body).execute()
+        self.service.spreadsheets().batchUpdate(spreadsheetId=self.sheet_id, body=body).execute()
 
 
 def update_google_sheet(csv_file, tab_name, num_rows=1000, num_cols=None):
@@ -516,8 +505,8 @@ def main():
         {"csv_file": f"{rag_path_to_db}all_discourse_articles.csv", "tab_name": "Discourse Articles in DB", "num_cols": 2},
     ]
 
-    # Using ThreadPoolExecutor to parallelize the updates
-    with ThreadPoolExecutor() as executor:
+    # Using ThreadPoolExecutor to parallelize the updates, one thread per tab since each one waits on the Sheets API
+    with ThreadPoolExecutor(max_workers=len(sheets_to_update)) as executor:
         futures = [executor.submit(update_google_sheet, config["csv_file"], config["tab_name"], config["num_cols"]) for
                    config in sheets_to_update]
 
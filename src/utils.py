@@ -1,22 +1,34 @@
 import asyncio
-import concurrent.futures
+import atexit
 import csv
+import hashlib
 import json
 import logging
 import os
+import queue
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from pathlib import Path
-from random import choice
-from typing import Optional, List, Union
+from random import choice, random
+from typing import Optional, List, Sequence, Union
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 
 import PyPDF2
+import aiohttp
+import google_auth_httplib2
+import httplib2
 import requests
-from bs4 import BeautifulSoup
 from google.oauth2.service_account import Credentials as ServiceAccountCredentials
 from googleapiclient.discovery import build
 from requests import Session
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from urllib3.util.retry import Retry
 
 USER_AGENTS = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -26,13 +38,156 @@ USER_AGENTS = [
 ]
 MAX_RETRIES = 3
 MAX_DELAY = 30
+PDF_CHUNK_SIZE = 1 << 16  # bytes read from the socket per write when streaming PDFs to disk
+PDF_WRITE_BUFFER_SIZE = 1 << 20  # file buffer of streamed PDFs, flushed to disk once per MiB rather than per chunk
+YOUTUBE_MAX_RESULTS_PER_PAGE = 50  # YouTube Data API caps maxResults at 50
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+MAX_FILENAME_BYTES = 255  # file name length limit of most filesystems
+MIN_PDF_SIZE = 1024  # bytes under which a PDF on disk is considered truncated and downloaded again
+# Characters of a paper title that cannot appear in a file name, applied in a single str.translate pass
+PDF_FILENAME_TRANSLATION = str.maketrans({'/': '<slash>', '\0': None})
+HTTP_CACHE_EXPIRE_AFTER = 7 * 24 * 3600  # seconds during which a cached page is served without fetching it again
+PAPER_DETAILS_CACHE_EXPIRE_AFTER = 30 * 24 * 3600  # seconds during which parsed paper details are reused
+PAPER_DETAILS_CACHE_VERSION = 3  # bump when a parsing method changes the details it returns, to ignore older entries
+BLOCKED_RESOURCE_URL_PATTERNS = ('*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.css', '*.woff', '*.woff2', '*analytics*', '*ads*')  # resources drivers with block_resources do not load
+# Requests per second allowed to each rate limited host of the aiohttp requests, see RateLimiter. The arXiv API
+# is called with requests and spaced by its own lock, see query_arxiv_api in get_research_paper_details.py.
+HOST_REQUESTS_PER_SECOND = {
+    'papers.ssrn.com': 1.0,
+    'eprint.iacr.org': 2.0,
+    'api.semanticscholar.org': 1 / 3,  # 100 unauthenticated requests per 5 minutes
+}
+HTTP_TIMEOUT = (5, 30)  # seconds to connect, and to wait for each read of the response
+MAX_CONCURRENT_PAPERS = 32  # default number of papers fetched concurrently per site
+MAX_CONCURRENT_PDF_DOWNLOADS = 16  # number of PDFs downloaded concurrently, independently of the pages being fetched
+PAPER_DETAILS_FIELDNAMES = ('title', 'authors', 'pdf_link', 'topics', 'release_date', 'referrer')
+
+# Shared HTTP session, built lazily by get_session()
+SESSION: Optional[Session] = None
+# Per-thread httplib2.Http used to execute YouTube API requests, see execute_request()
+_THREAD_LOCAL = threading.local()
+# Guards the PDF validators (ETag / Last-Modified per PDF URL) updated by concurrent downloads
+_PDF_VALIDATORS_LOCK = threading.Lock()
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 
+def make_session() -> Session:
+    """
+    Build a requests Session with a pooled keep-alive HTTPAdapter and retries on transient errors,
+    so that consecutive requests to the same host reuse the TCP+TLS connection.
+
+    Returns:
+    - Session: The configured requests Session.
+    """
+    session = Session()
+    session.headers.update({'User-Agent': USER_AGENTS[0]})
+    # Once the retries are exhausted, return the last response rather than raising a RetryError,
+    # so that callers keep checking the status code or calling raise_for_status
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=RETRY_STATUS_CODES, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> Session:
+    """
+    Return the HTTP session of the current process, building it on first use.
+    """
+    global SESSION
+    if SESSION is None:
+        SESSION = make_session()
+    return SESSION
+
+
+def make_aiohttp_session() -> aiohttp.ClientSession:
+    """
+    Build an aiohttp ClientSession with bounded connection pools, cached DNS lookups and timeouts,
+    so that thousands of scheduled requests do not pile up sockets or stall on DNS resolution.
+    Must be called from within a running event loop.
+
+    Returns:
+    - aiohttp.ClientSession: The configured session.
+    """
+    connector = aiohttp.TCPConnector(limit=64, limit_per_host=16, ttl_dns_cache=900, use_dns_cache=True, enable_cleanup_closed=True)
+    # No cap on the total duration, which would abort large PDFs on slow links: a stalled read fails instead
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=HTTP_TIMEOUT[0], sock_read=HTTP_TIMEOUT[1])
+    return aiohttp.ClientSession(connector=connector, timeout=timeout, headers={'User-Agent': USER_AGENTS[0]})
+
+
+class RateLimiter:
+    """
+    Token bucket spacing the requests sent to a host by the coroutines of an event loop thread.
+
+    Tokens are reserved without awaiting, so concurrent coroutines need no lock: each one takes the next
+    token and sleeps until it is due. The bucket holds no event loop state and outlives asyncio.run calls.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+        # A negative balance counts the tokens already promised to the coroutines waiting before this one
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self._rate)
+
+
+_RATE_LIMITERS = {}
+
+
+def host_rate_limiter(url: str) -> Optional[RateLimiter]:
+    host = urlsplit(url).hostname
+    if host not in HOST_REQUESTS_PER_SECOND:
+        return None
+    if host not in _RATE_LIMITERS:
+        _RATE_LIMITERS[host] = RateLimiter(HOST_REQUESTS_PER_SECOND[host])
+    return _RATE_LIMITERS[host]
+
+
+async def get_with_retry(session: aiohttp.ClientSession, url: str, tries: int = 4, **kwargs) -> aiohttp.ClientResponse:
+    """
+    Issue a GET request, retrying with exponential backoff and jitter on connection errors and on RETRY_STATUS_CODES.
+    Each attempt to a host of HOST_REQUESTS_PER_SECOND first waits for its rate limiter.
+    The returned response must be released by the caller, e.g. with `async with await get_with_retry(...) as response`.
+
+    Parameters:
+    - session (aiohttp.ClientSession): The session to issue the request with.
+    - url (str): The URL to fetch.
+    - tries (int): Maximum number of attempts.
+    - **kwargs: Forwarded to session.get.
+
+    Returns:
+    - aiohttp.ClientResponse: The last response received.
+    """
+    rate_limiter = host_rate_limiter(url)
+    for attempt in range(tries):
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+        try:
+            response = await session.get(url, **kwargs)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt == tries - 1:
+                raise
+        else:
+            if response.status not in RETRY_STATUS_CODES or attempt == tries - 1:
+                return response
+            response.release()
+        await asyncio.sleep(2 ** attempt + random())
+
+
+@lru_cache(maxsize=1)
 def root_directory() -> str:
     """
     Determine the root directory of the project. It checks if it's running in a Docker container and adjusts accordingly.
+    The result is cached, the lookup spawns a git subprocess and may walk up the filesystem.
 
     Returns:
     - str: The path to the root directory of the project.
@@ -84,6 +239,12 @@ def root_directory() -> str:
     raise Exception("Could not find the root directory of the project. Please make sure you are running this script from within a Git repository.")
 
 
+@lru_cache(maxsize=1)
+def papers_pdf_directory() -> str:
+    # Where the PDFs of research papers are downloaded, joined once rather than once per paper
+    return os.path.join(root_directory(), 'data', 'papers_pdf_downloads')
+
+
 def ensure_newline_in_csv(csv_file: str) -> None:
     """
     Ensure that a CSV file ends with a newline.
@@ -92,117 +253,231 @@ def ensure_newline_in_csv(csv_file: str) -> None:
     - csv_file (str): Path to the CSV file.
     """
     try:
-        with open(csv_file, 'a+', newline='') as f:  # Using 'a+' mode to allow reading
-            # Move to the beginning of the file to check its content
-            f.seek(0, os.SEEK_SET)
-            if not f.read():  # File is empty
-                return
-
-            # Move to the end of the file
-            f.seek(0, os.SEEK_END)
-
-            # Check if the file ends with a newline, if not, add one
-            if f.tell() > 0:
-                f.seek(f.tell() - 1, os.SEEK_SET)
-                if f.read(1) != '\n':
-                    f.write('\n')
+        if not os.path.exists(csv_file) or os.path.getsize(csv_file) == 0:
+            return
+        # Only the last byte is read, whatever the size of the file
+        with open(csv_file, 'rb+') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                f.write(b'\n')
     except Exception as e:
         logging.error(f"Failed to ensure newline in {csv_file}. Error: {e}")
 
 
+class CsvAppender:
+    """
+    Append rows to a CSV file through a single buffered file handle.
+
+    The file is opened once, in append mode, and the header is written only if the file is new or empty.
+    It is checked once for a trailing newline, rather than once per row:
+    every row written afterwards ends with one. Rows are dicts and are written as tuples in field order,
+    with '\n' line endings like the rest of the CSV files of the repository.
+    The buffer is flushed every flush_every rows, so that an interrupted run keeps the rows written so far.
+
+    Usage:
+        with CsvAppender(csv_file, fieldnames) as appender:
+            appender.write(row)
+    """
+
+    def __init__(self, csv_file: str, fieldnames: Sequence[str], flush_every: int = 50):
+        self.fieldnames = fieldnames
+        self._flush_every = flush_every
+        self._unflushed_rows = 0
+        is_new_file = not os.path.exists(csv_file) or os.path.getsize(csv_file) == 0
+        if not is_new_file:
+            ensure_newline_in_csv(csv_file)
+        self._file = open(csv_file, 'a', newline='', buffering=1 << 20)
+        self._writer = csv.writer(self._file, lineterminator='\n')
+        if is_new_file:
+            self._writer.writerow(fieldnames)
+
+    def write(self, row: dict) -> None:
+        self._writer.writerow(tuple(row.get(field, '') for field in self.fieldnames))
+        self._unflushed_rows += 1
+        if self._unflushed_rows >= self._flush_every:
+            self._file.flush()
+            self._unflushed_rows = 0
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def paper_titles_index_path(csv_file: str) -> str:
+    return os.path.join(http_cache_directory('titles'), f"{hashlib.sha256(os.path.abspath(csv_file).encode('utf-8')).hexdigest()}.json")
+
+
 def read_existing_papers(csv_file):
     """
     Read existing paper titles from a CSV file.
+    The titles are read from the index saved by save_existing_papers_index if the CSV file was not modified since.
 
     Parameters:
     - csv_file (str): Path to the CSV file where details are saved.
 
     Returns:
-    - list: A list of titles of existing papers.
+    - set: The titles of existing papers, normalized with paper_title_key.
     """
     if not os.path.exists(csv_file):
-        return []
+        return set()
+
+    stat = os.stat(csv_file)
+    try:
+        with open(paper_titles_index_path(csv_file), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index['size'] == stat.st_size and index['mtime_ns'] == stat.st_mtime_ns:
+            return set(index['titles'])
+    except (OSError, ValueError, KeyError):
+        pass
 
     with open(csv_file, mode='r') as csvfile:
         reader = csv.DictReader(csvfile)
-        return [row['title'] for row in reader]
+        return {paper_title_key(row['title']) for row in reader}
 
 
-def paper_exists_in_csv(paper_title: str, csv_file: str) -> bool:
+def save_existing_papers_index(csv_file: str, existing_papers: set) -> None:
     """
-    Check if a paper with the given title exists in the CSV file.
+    Save the titles of a CSV file along with its size and modification time, so that the next read_existing_papers
+    does not parse the CSV file again. Any other change of the CSV file invalidates the index.
+
+    Parameters:
+    - csv_file (str): Path to the CSV file, closed after its last write.
+    - existing_papers (set): The titles of all the papers of the CSV file, normalized with paper_title_key.
     """
-    with open(csv_file, 'r', newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            if row['title'] == paper_title:
-                return True
-    return False
+    path = paper_titles_index_path(csv_file)
+    stat = os.stat(csv_file)
+    part_path = temporary_path(path)
+    with open(part_path, 'w', encoding='utf-8') as f:
+        json.dump({'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'titles': sorted(existing_papers)}, f, ensure_ascii=False)
+    os.replace(part_path, path)
 
 
 def read_csv_links_and_referrers(file_path):
-    # try to open file path and if it does not exist just return an empty list
+    # Yield the (link, referrer) pairs as the file is read, a missing file yields nothing
     if not os.path.exists(file_path):
-        return []
+        return
     with open(file_path, mode='r') as f:
-        reader = csv.DictReader(f)
-        return [(row['paper'], row['referrer']) for row in reader]
+        for row in csv.DictReader(f):
+            yield row['paper'], row['referrer']
 
 
-def paper_exists_in_list(title: str, existing_papers: list) -> bool:
+def paper_title_key(title: str) -> str:
     """
-    Check if a paper title already exists in a list of existing papers.
+    Normalize a paper title so that the same title compares equal regardless of case and whitespace.
+    """
+    return ' '.join(title.split()).casefold()
+
+
+def paper_exists_in_list(title: str, existing_papers: set) -> bool:
+    """
+    Check if a paper title already exists in the existing papers.
 
     Parameters:
     - title (str): The title of the paper.
-    - existing_papers (list): List of existing paper titles.
+    - existing_papers (set): Set of existing paper titles, as returned by read_existing_papers.
 
     Returns:
-    - bool: True if title exists in the list, False otherwise.
+    - bool: True if title exists in the set, False otherwise.
     """
-    return title in existing_papers
+    return paper_title_key(title) in existing_papers
 
 
-def paper_exists_in_csv(title: str, csv_file: str) -> bool:
-    """
-    Check if a paper title already exists in a given CSV file.
+def temporary_path(path: str) -> str:
+    # Unique per process and thread, so that concurrent writers of the same file never share their temporary file
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.part"
 
-    Parameters:
-    - title (str): The title of the paper.
-    - csv_file (str): Path to the CSV file.
 
-    Returns:
-    - bool: True if title exists in the CSV, False otherwise.
+@lru_cache(maxsize=None)
+def http_cache_directory(*subdirectories: str) -> str:
     """
+    Return a directory of the on-disk HTTP cache, created on first use rather than checked before every write.
+    """
+    directory = os.path.join(root_directory(), 'data', 'http_cache', *subdirectories)
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def http_cache_path(url: str) -> str:
+    return os.path.join(http_cache_directory(), hashlib.sha256(url.encode('utf-8')).hexdigest())
 
+
+def is_http_cache_fresh(path: str, expire_after: int = HTTP_CACHE_EXPIRE_AFTER) -> bool:
     try:
-        with open(csv_file, 'r', newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                if row['title'] == title:
-                    return True
-    except FileNotFoundError:
+        return time.time() - os.path.getmtime(path) < expire_after
+    except OSError:  # Not cached yet
         return False
-    return False
 
 
-def quickSoup(url) -> BeautifulSoup or None:
+def paper_details_cache_path(url: str) -> str:
+    return os.path.join(http_cache_directory('details'), f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json")
+
+
+def read_paper_details_cache(url: str) -> Optional[dict]:
+    """
+    Read the paper details parsed from a URL by a previous run.
+
+    Returns:
+    - dict: The cached details.
+    - None: If the details are not cached, expired, or were cached by another PAPER_DETAILS_CACHE_VERSION.
+    """
+    path = paper_details_cache_path(url)
+    if not is_http_cache_fresh(path, PAPER_DETAILS_CACHE_EXPIRE_AFTER):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry.get('version') != PAPER_DETAILS_CACHE_VERSION:
+        return None
+    return entry['details']
+
+
+def write_paper_details_cache(url: str, details: dict) -> None:
+    path = paper_details_cache_path(url)
+    part_path = temporary_path(path)
+    with open(part_path, 'w', encoding='utf-8') as f:
+        json.dump({'url': url, 'version': PAPER_DETAILS_CACHE_VERSION, 'fetched_at': time.time(), 'details': details}, f, ensure_ascii=False)
+    os.replace(part_path, path)
+
+
+async def fetch_page_async(session: aiohttp.ClientSession, url: str) -> Optional[str]:
     """
-    Quickly retrieve and parse an HTML page into a BeautifulSoup object.
+    Fetch a page with the shared aiohttp session into the on-disk HTTP cache.
+    The body is streamed to disk chunk by chunk rather than held in memory, and cached pages are
+    not fetched again for HTTP_CACHE_EXPIRE_AFTER seconds.
 
     Parameters:
+    - session (aiohttp.ClientSession): The session to issue the request with.
     - url (str): The URL of the page to be fetched.
 
     Returns:
-    - BeautifulSoup object: Parsed HTML of the page.
+    - str: The path of the file holding the page, to be parsed by the caller.
     - None: If there's an error during retrieval.
     """
+    path = http_cache_path(url)
+    if is_http_cache_fresh(path):
+        return path
+    # Write to a temporary file first so that concurrent readers never see a partial page
+    part_path = temporary_path(path)
     try:
-        header = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-        soup = BeautifulSoup(requests.get(url, headers=header, timeout=10).content, 'html.parser')
-        return soup
-    except Exception:
+        async with await get_with_retry(session, url, headers={'User-Agent': choice(USER_AGENTS)}) as response:
+            response.raise_for_status()
+            with open(part_path, 'wb') as f:
+                async for chunk in response.content.iter_chunked(PDF_CHUNK_SIZE):
+                    f.write(chunk)
+        os.replace(part_path, path)
+        return path
+    except (aiohttp.ClientError, asyncio.TimeoutError):
         return None
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
 
 
 def background(f):
@@ -242,30 +517,60 @@ def authenticate_service_account(service_account_file: str) -> ServiceAccountCre
     return credentials
 
 
-def get_playlist_title(credentials: ServiceAccountCredentials, api_key: str, playlist_id: str) -> Optional[str]:
+def build_youtube_client(credentials: Optional[ServiceAccountCredentials], api_key: str):
     """
-    Retrieves the title of a YouTube playlist using the YouTube Data API.
+    Build the YouTube Data API client. Building parses the API discovery document, so build it once per run
+    and pass it to the YouTube helpers.
 
     Args:
+        credentials (Optional[ServiceAccountCredentials]): Service account credentials, if any.
         api_key (str): Your YouTube Data API key.
+
+    Returns:
+        Resource: The YouTube Data API client.
+    """
+    return build('youtube', 'v3', credentials=credentials, developerKey=api_key, cache_discovery=False)
+
+
+def execute_request(request):
+    """
+    Execute a YouTube API request on an httplib2.Http owned by the calling thread.
+    httplib2.Http is not thread-safe, and the client built by build_youtube_client is shared across threads.
+
+    Args:
+        request (HttpRequest): The request to execute.
+
+    Returns:
+        dict: The response.
+    """
+    http = getattr(_THREAD_LOCAL, 'http', None)
+    if http is None:
+        http = httplib2.Http()
+        credentials = getattr(request.http, 'credentials', None)
+        if credentials is not None:
+            http = google_auth_httplib2.AuthorizedHttp(credentials, http=http)
+        _THREAD_LOCAL.http = http
+    return request.execute(http=http)
+
+
+def get_playlist_title(youtube, playlist_id: str) -> Optional[str]:
+    """
+    Retrieves the title of a YouTube playlist using the YouTube Data API.
+
+    Args:
+        youtube (Resource): The client returned by build_youtube_client.
         playlist_id (str): The YouTube playlist ID.
 
     Returns:
         Optional[str]: The title of the playlist if found, otherwise None.
     """
-    # Initialize the YouTube API client
-    if credentials is None:
-        youtube = build('youtube', 'v3', developerKey=api_key)
-    else:
-        youtube = build('youtube', 'v3', credentials=credentials, developerKey=api_key)
-
     request = youtube.playlists().list(
         part='snippet',
         id=playlist_id,
         fields='items(snippet/title)',
         maxResults=1
     )
-    response = request.execute()
+    response = execute_request(request)
     items = response.get('items', [])
 
     if items:
@@ -274,13 +579,7 @@ def get_playlist_title(credentials: ServiceAccountCredentials, api_key: str, pla
         return None
 
 
-def get_videos_from_playlist(credentials: ServiceAccountCredentials, api_key: str, playlist_id: str, max_results: int = 5000) -> List[dict]:
-    # Initialize the YouTube API client
-    if credentials is None:
-        youtube = build('youtube', 'v3', developerKey=api_key)
-    else:
-        youtube = build('youtube', 'v3', credentials=credentials, developerKey=api_key)
-
+def get_videos_from_playlist(youtube, playlist_id: str, max_results: int = 5000) -> List[dict]:
     video_info = []
     next_page_token = None
 
@@ -288,11 +587,11 @@ def get_videos_from_playlist(credentials: ServiceAccountCredentials, api_key: st
         playlist_request = youtube.playlistItems().list(
             part="snippet",
             playlistId=playlist_id,
-            maxResults=max_results,
+            maxResults=min(max_results, YOUTUBE_MAX_RESULTS_PER_PAGE),
             pageToken=next_page_token,
             fields="nextPageToken,items(snippet(publishedAt,resourceId(videoId),title))"
         )
-        playlist_response = playlist_request.execute()
+        playlist_response = execute_request(playlist_request)
         items = playlist_response.get('items', [])
 
         for item in items:
@@ -312,19 +611,16 @@ def get_videos_from_playlist(credentials: ServiceAccountCredentials, api_key: st
     return video_info
 
 
-def get_root_directory():
-    current_dir = os.getcwd()
-
-    while True:
-        if '.git' in os.listdir(current_dir):
-            return current_dir
-        else:
-            # Go up one level
-            current_dir = os.path.dirname(current_dir)
-
-
-def get_channel_name(api_key, channel_handle):
-    youtube = build('youtube', 'v3', developerKey=api_key)
+def get_channel_name(youtube, api_key, channel_handle):
+    # channels.list costs 1 quota unit against 100 for search.list, only search when the handle is not resolved.
+    # Queried over REST since forHandle is missing from the discovery document bundled with older client versions.
+    response = get_session().get(
+        "https://www.googleapis.com/youtube/v3/channels",
+        params={'part': 'snippet', 'forHandle': channel_handle, 'fields': 'items(snippet(title))', 'key': api_key},
+        timeout=10
+    )
+    if response.ok and response.json().get('items'):
+        return response.json()['items'][0]['snippet']['title']
 
     request = youtube.search().list(
         part='snippet',
@@ -333,9 +629,9 @@ def get_channel_name(api_key, channel_handle):
         maxResults=1,
         fields='items(snippet(channelTitle))'
     )
-    response = request.execute()
+    response = execute_request(request)
 
-    if response['items']:
+    if response.get('items'):
         return response['items'][0]['snippet']['channelTitle']
     else:
         return None
@@ -358,28 +654,53 @@ async def get_channel_id(session, api_key, channel_name, channel_name_to_id):
     if channel_name in channel_name_to_id:
         return channel_name_to_id[channel_name]
 
-    url = f"https://www.googleapis.com/youtube/v3/search?part=snippet&type=channel&maxResults=1&q={channel_name}&key={api_key}"
-    async with session.get(url) as response:
-        if response.status == 200:
+    # channels.list costs 1 quota unit against 100 for search.list, only search when the handle is not resolved
+    lookups = [
+        ("https://www.googleapis.com/youtube/v3/channels", {'part': 'id', 'forHandle': channel_name, 'fields': 'items/id', 'key': api_key}),
+        ("https://www.googleapis.com/youtube/v3/search", {'part': 'snippet', 'type': 'channel', 'maxResults': 1, 'q': channel_name, 'key': api_key}),
+    ]
+    for url, params in lookups:
+        async with await get_with_retry(session, url, params=params) as response:
+            if response.status != 200:
+                continue
             data = await response.json()
             items = data.get('items', [])
             if items:
-                channel_id = items[0]['id']['channelId']
+                channel_id = items[0]['id'] if isinstance(items[0]['id'], str) else items[0]['id']['channelId']
                 channel_name_to_id[channel_name] = channel_id  # Update the mapping
                 return channel_id
-        return None  # Handle errors or missing data as appropriate for your application
+    return None  # Handle errors or missing data as appropriate for your application
 
 
-def return_driver(headless=False):
+def return_driver(headless=False, extra_arguments=(), use_automation_extension=True, block_resources=False, page_load_timeout=None):
+    """
+    Start a Chrome driver.
+
+    Parameters:
+    - headless (bool): Whether to run Chrome without a window.
+    - extra_arguments (tuple): Additional Chrome command line arguments.
+    - use_automation_extension (bool): Whether to load the Chrome automation extension.
+    - block_resources (bool): Whether to skip images, stylesheets, fonts and trackers, and to return from driver.get
+      once the DOM is loaded. Meant for drivers that only read the page source.
+    - page_load_timeout (float, optional): Seconds after which driver.get raises a TimeoutException.
+    """
     # set up Chrome driver options
     options = webdriver.ChromeOptions()
     # options.add_argument("--disable-blink-features=AutomationControlled")
     # options.add_argument("--start-maximized")
-    # options.add_argument("--no-sandbox")
-    # options.add_argument("--disable-dev-shm-usage")
     # options.add_argument("--remote-debugging-port=9222")
     # options.add_argument("--disable-gpu")
     # options.add_argument("--disable-features=IsolateOrigins,site-per-process")
+    for argument in extra_arguments:
+        options.add_argument(argument)
+    if not use_automation_extension:
+        options.add_experimental_option('useAutomationExtension', False)
+    if block_resources:
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+        })
+        options.page_load_strategy = 'eager'
 
     # # Add headless option if required
     if headless:
@@ -400,67 +721,238 @@ def return_driver(headless=False):
     options.binary_location = CHROME_BINARY_PATH
 
     driver = webdriver.Chrome(executable_path=CHROMEDRIVER_PATH, chrome_options=options)
+    if page_load_timeout is not None:
+        driver.set_page_load_timeout(page_load_timeout)
+    if block_resources:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(BLOCKED_RESOURCE_URL_PATTERNS)})
     return driver
 
 
 def return_driver_get_discourse(headless=False):
-    # set up Chrome driver options
-    options = webdriver.ChromeOptions()
-    # options.add_argument("--disable-blink-features=AutomationControlled")
-    # options.add_argument("--start-maximized")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    # options.add_argument("--remote-debugging-port=9222")
-    # options.add_argument("--disable-gpu")
-    # options.add_argument("--disable-features=IsolateOrigins,site-per-process")
-    options.add_experimental_option('useAutomationExtension', False)
+    return return_driver(headless, extra_arguments=("--no-sandbox", "--disable-dev-shm-usage"), use_automation_extension=False)
 
-    # # Add headless option if required
-    if headless:
-        options.add_argument("--headless")
 
-    # options.add_experimental_option('excludeSwitches', ['enable-logging'])
+class DriverPool:
+    """
+    Pool of Selenium Chrome drivers, reused across pages instead of starting a browser per page.
 
-    # NOTE: ChromeDriverManager().install() no longer works
-    # needed to manually go here https://googlechromelabs.github.io/chrome-for-testing/#stable
-    # and provide direct paths to script for both binary and driver
-    # First run the script get_correct_chromedriver.sh
-    # Paths for the Chrome binary and ChromeDriver
-    # TODO 2023-09-18: add GIT LFS unroll of chromium folder when hitting this script
-    CHROME_BINARY_PATH = f'{root_directory()}/src/chromium/chrome-linux64/chrome'
-    CHROMEDRIVER_PATH = f'{root_directory()}/src/chromium/chromedriver-linux64/chromedriver'
+    Drivers are started on demand, up to size, and all quit when the interpreter exits.
 
-    # options = webdriver.ChromeOptions()
-    options.binary_location = CHROME_BINARY_PATH
+    Usage:
+        with pool.driver() as driver:
+            driver.get(url)
+    """
+
+    def __init__(self, size: int, **driver_kwargs):
+        self._driver_kwargs = driver_kwargs
+        self._idle_drivers = queue.LifoQueue()
+        self._drivers = []
+        self._drivers_lock = threading.Lock()
+        self._slots = threading.Semaphore(size)
+        atexit.register(self.quit)
+
+    @contextmanager
+    def driver(self):
+        with self._slots:
+            try:
+                driver = self._idle_drivers.get_nowait()
+            except queue.Empty:
+                driver = return_driver(**self._driver_kwargs)
+                with self._drivers_lock:
+                    self._drivers.append(driver)
+            broken = False
+            try:
+                yield driver
+            except TimeoutException:
+                raise  # the page was slow, the browser itself is fine
+            except WebDriverException:
+                broken = True
+                raise
+            finally:
+                if not broken:
+                    # Do not leak the cookies of a site to the next page
+                    try:
+                        driver.delete_all_cookies()
+                    except Exception as e:
+                        logging.warning(f"Failed to clear the cookies of a pooled driver, discarding it. Error: {e}")
+                        broken = True
+                if broken:
+                    # A crashed browser is not handed to the next borrower, which starts a new one instead
+                    self._discard(driver)
+                else:
+                    self._idle_drivers.put(driver)
+
+    def _discard(self, driver) -> None:
+        with self._drivers_lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def quit(self) -> None:
+        with self._drivers_lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
 
-    driver = webdriver.Chrome(executable_path=CHROMEDRIVER_PATH, chrome_options=options)
-    return driver
 
 def create_directory(directory):
     os.makedirs(directory, exist_ok=True)
 
 
-def download_pdf(pdf_link, original_url, retries=0, delay=1):
+def pdf_filename_from_title(title: str) -> str:
+    """
+    Build the file name of a paper PDF from its title. '/' is replaced with '<slash>' as done for thumbnails.
+    Names longer than MAX_FILENAME_BYTES are truncated on their UTF-8 encoding and suffixed with a hash of
+    the title, so that two long titles sharing a prefix do not map to the same file.
+
+    Parameters:
+    - title (str): The title of the paper.
+
+    Returns:
+    - str: The PDF file name.
+    """
+    name = title.translate(PDF_FILENAME_TRANSLATION)
+    encoded_name = name.encode('utf-8')
+    if len(encoded_name) > MAX_FILENAME_BYTES - len('.pdf'):
+        suffix = f"-{hashlib.sha256(encoded_name).hexdigest()[:12]}"
+        name = encoded_name[:MAX_FILENAME_BYTES - len('.pdf') - len(suffix)].decode('utf-8', errors='ignore') + suffix
+    return f"{name}.pdf"
+
+
+@lru_cache(maxsize=1)
+def load_pdf_validators() -> dict:
+    """
+    Load the ETag / Last-Modified headers of the downloaded PDFs, keyed by PDF URL.
+    The dictionary is cached and updated in place by the PDF downloads, persist it with save_pdf_validators.
+    """
+    validators_path = os.path.join(root_directory(), 'data', 'pdf_validators.json')
+    if os.path.exists(validators_path):
+        with open(validators_path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    return {}
+
+
+def save_pdf_validators() -> None:
+    validators_path = os.path.join(root_directory(), 'data', 'pdf_validators.json')
+    with _PDF_VALIDATORS_LOCK:
+        with open(validators_path, 'w', encoding='utf-8') as file:
+            json.dump(load_pdf_validators(), file, ensure_ascii=False, indent=4)
+
+
+def local_pdf_copy(pdf_link: str, pdf_path: str) -> Optional[str]:
+    """
+    Return the path of a copy on disk of the PDF at pdf_link: pdf_path itself, or the file the link was last
+    downloaded to, e.g. under the name derived from another spelling of the title. None if there is no copy.
+    """
+    if os.path.exists(pdf_path):
+        return pdf_path
+    recorded_file = load_pdf_validators().get(pdf_link, {}).get('file')
+    if recorded_file:
+        recorded_path = os.path.join(os.path.dirname(pdf_path), recorded_file)
+        if os.path.exists(recorded_path):
+            return recorded_path
+    return None
+
+
+def pdf_conditional_headers(pdf_link: str, local_path: Optional[str]) -> dict:
+    """
+    Return the If-None-Match / If-Modified-Since headers of the local copy of a PDF, see local_pdf_copy,
+    from the validators recorded at its previous download. Empty if either is missing.
+    """
+    validators = load_pdf_validators().get(pdf_link)
+    if not validators or local_path is None:
+        return {}
+    headers = {}
+    if 'ETag' in validators:
+        headers['If-None-Match'] = validators['ETag']
+    if 'Last-Modified' in validators:
+        headers['If-Modified-Since'] = validators['Last-Modified']
+    return headers
+
+
+def keep_local_pdf(pdf_link: str, local_path: str, pdf_path: str) -> None:
+    """
+    Keep the local copy of a PDF the server answered 304 Not Modified for, moved to pdf_path if it was saved under
+    another name, so that the next runs find it without a request.
+    """
+    if local_path != pdf_path:
+        os.replace(local_path, pdf_path)
+        with _PDF_VALIDATORS_LOCK:
+            load_pdf_validators()[pdf_link]['file'] = os.path.basename(pdf_path)
+
+
+def record_pdf_validators(pdf_link: str, pdf_path: str, response_headers) -> None:
+    """
+    Record the ETag / Last-Modified headers of a downloaded PDF and the name of its file, persisted by save_pdf_validators.
+    """
+    pdf_validators = {header: response_headers[header] for header in ('ETag', 'Last-Modified') if header in response_headers}
+    if pdf_validators:
+        pdf_validators['file'] = os.path.basename(pdf_path)
+        with _PDF_VALIDATORS_LOCK:
+            load_pdf_validators()[pdf_link] = pdf_validators
+
+
+def download_pdf(pdf_link, original_url, pdf_path, retries=0, delay=1) -> bool:
+    """
+    Stream a PDF to disk chunk by chunk, so that at most PDF_CHUNK_SIZE bytes are held in memory.
+    If the PDF is already on disk, at pdf_path or under the file name recorded at its previous download, the request
+    is made conditional on the validators recorded then, and a 304 Not Modified response keeps the local file
+    without transferring the body.
+
+    Parameters:
+    - pdf_link (str): The URL of the PDF.
+    - original_url (str): The referrer URL.
+    - pdf_path (str): Where to write the PDF.
+
+    Returns:
+    - bool: True if pdf_path holds the PDF, False otherwise.
+    """
     if retries >= MAX_RETRIES:
-        return None
+        return False
 
     headers = {
         'User-Agent': choice(USER_AGENTS),
         'Referer': original_url
     }
-
-    session = Session()
+    local_path = local_pdf_copy(pdf_link, pdf_path)
+    headers.update(pdf_conditional_headers(pdf_link, local_path))
 
     try:
-        response = session.get(pdf_link, headers=headers)
-        response.raise_for_status()
+        with get_session().get(pdf_link, headers=headers, stream=True, timeout=HTTP_TIMEOUT) as response:
+            response.raise_for_status()
+
+            if response.status_code == 304:  # Not Modified, the local file is up to date
+                keep_local_pdf(pdf_link, local_path, pdf_path)
+                return True
 
-        if response.headers['Content-Type'] == 'application/pdf':
-            return response.content
+            if response.headers.get('Content-Type') != 'application/pdf':
+                return False
+
+            # Write to a temporary file renamed once complete: pdf_path never holds a truncated PDF,
+            # even if the process is killed mid-download
+            part_path = temporary_path(pdf_path)
+            try:
+                with open(part_path, "wb", buffering=PDF_WRITE_BUFFER_SIZE) as f:
+                    for chunk in response.iter_content(chunk_size=PDF_CHUNK_SIZE):
+                        f.write(chunk)
+                os.replace(part_path, pdf_path)
+            finally:
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+
+            record_pdf_validators(pdf_link, pdf_path, response.headers)
+            return True
 
     except requests.RequestException as e:
-        if response.status_code == 429:  # Too Many Requests
-            retry_after = response.headers.get('Retry-After')
+        if e.response is not None and e.response.status_code == 429:  # Too Many Requests
+            retry_after = e.response.headers.get('Retry-After')
             if retry_after:
                 delay = int(retry_after)  # Use the Retry-After header for delay if present
             else:
@@ -468,94 +960,190 @@ def download_pdf(pdf_link, original_url, retries=0, delay=1):
 
             logging.warning(f"[{pdf_link}] Rate limited. Retrying in {delay} seconds...")
             time.sleep(delay)
-            return download_pdf(pdf_link, original_url, retries + 1, delay)
+            return download_pdf(pdf_link, original_url, pdf_path, retries + 1, delay)
         else:
             logging.error(f"Failed to download PDF from {pdf_link}. Error: {e}")
-            return None
+            return False
+
+
+async def download_pdf_async(session: aiohttp.ClientSession, pdf_link: str, original_url: str, pdf_path: str) -> bool:
+    """
+    Stream a PDF to disk with the shared aiohttp session. Like download_pdf, the request is conditional
+    on the validators recorded for a local copy of the PDF, and a 304 Not Modified response keeps that copy.
+
+    Parameters:
+    - session (aiohttp.ClientSession): The session to issue the request with.
+    - pdf_link (str): The URL of the PDF.
+    - original_url (str): The referrer URL.
+    - pdf_path (str): Where to write the PDF.
 
+    Returns:
+    - bool: True if a PDF was written to pdf_path, False otherwise.
+    """
+    local_path = local_pdf_copy(pdf_link, pdf_path)
+    headers = {
+        'User-Agent': choice(USER_AGENTS),
+        'Referer': original_url,
+        **pdf_conditional_headers(pdf_link, local_path)
+    }
+    try:
+        async with await get_with_retry(session, pdf_link, headers=headers) as response:
+            response.raise_for_status()
+            if response.status == 304:  # Not Modified, the local file is up to date
+                keep_local_pdf(pdf_link, local_path, pdf_path)
+                return True
+            if response.headers.get('Content-Type') != 'application/pdf':
+                return False
+            # Write to a temporary file renamed once complete, see download_pdf
+            part_path = temporary_path(pdf_path)
+            try:
+                with open(part_path, "wb", buffering=PDF_WRITE_BUFFER_SIZE) as f:
+                    async for chunk in response.content.iter_chunked(PDF_CHUNK_SIZE):
+                        f.write(chunk)
+                os.replace(part_path, pdf_path)
+            finally:
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+            record_pdf_validators(pdf_link, pdf_path, response.headers)
+            return True
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logging.error(f"Failed to download PDF from {pdf_link}. Error: {e}")
+    return False
 
-def download_and_save_unique_paper(args):
+
+async def download_and_save_unique_paper(session, page_semaphore, pdf_semaphore, paper_site, appender, existing_papers, pdf_directory, existing_pdfs, parsing_method, prefetched_details, link, referrer):
     """
     Download a paper from its link and save its details to a CSV file.
 
     Parameters:
-    - args (tuple): A tuple containing the following elements:
-        - paper_site (str): The website where the paper is hosted.
-        - link (str): Direct link to the paper's details page (not the PDF link).
-        - csv_file (str): Path to the CSV file where details should be saved.
-        - existing_papers (list): List of existing paper titles in the directory.
-        - headers (dict): Headers to be used in the HTTP request to fetch paper details.
-        - referrer (str): Referrer URL or identifier to be stored alongside paper details.
-        - parsing_method (function): The function to use for parsing the paper details from the webpage.
-    """
-    paper_site, link, csv_file, existing_papers, headers, referrer, parsing_method = args
-    paper_page_url = link.replace('.pdf', '')
-    paper_details = parsing_method(paper_page_url)
+    - session (aiohttp.ClientSession): Shared HTTP session used to download the PDF.
+    - page_semaphore (asyncio.Semaphore): Bounds the number of paper pages fetched and parsed concurrently.
+    - pdf_semaphore (asyncio.Semaphore): Bounds the number of PDFs downloaded concurrently. A slow PDF download
+      does not hold a page slot, the next pages are parsed meanwhile.
+    - paper_site (str): The website where the paper is hosted.
+    - appender (CsvAppender): Appender of the CSV file where details should be saved.
+    - existing_papers (set): Normalized titles already in the CSV file, read once per run and updated as rows are written.
+    - pdf_directory (str): Directory where the PDFs are saved.
+    - existing_pdfs (set): File names in pdf_directory, listed once per batch and claimed before each download.
+    - parsing_method (function): The function to use for parsing the paper details from the webpage,
+      either synchronous taking the page URL or a coroutine function taking the page URL and the session.
+    - prefetched_details (dict): Details fetched in bulk for the whole site, keyed by page URL, used instead of parsing_method.
+    - link (str): Direct link to the paper's details page (not the PDF link).
+    - referrer (str): Referrer URL or identifier to be stored alongside paper details.
 
-    if paper_details is None:
-        logging.error(f"[{paper_site}] Failed to fetch details for {paper_page_url}")
-        return
+    """
+    paper_page_url = link.replace('.pdf', '')
+    async with page_semaphore:
+        if paper_page_url in prefetched_details:
+            paper_details = dict(prefetched_details[paper_page_url])
+        else:
+            # Details parsed by a previous run skip the page fetch and the parsing altogether
+            paper_details = read_paper_details_cache(paper_page_url)
+        if paper_details is None:
+            # A paper failing to parse must not fail the gather of the whole site: log it and move on
+            try:
+                if asyncio.iscoroutinefunction(parsing_method):
+                    # Asynchronous parsing methods fetch their page with the shared session
+                    paper_details = await parsing_method(paper_page_url, session)
+                else:
+                    # Synchronous parsing methods (requests, arxiv, selenium) run off the event loop
+                    paper_details = await asyncio.to_thread(parsing_method, paper_page_url)
+            except Exception as e:
+                logging.error(f"[{paper_site}] Failed to parse the paper details of {paper_page_url}. Error: {e}")
+                return
 
-    # Append details to CSV if paper does not exist in CSV
-    if not paper_exists_in_csv(paper_details['title'], csv_file):
-        # Ensure CSV ends with a newline
-        ensure_newline_in_csv(csv_file)
+            if paper_details is None:
+                logging.error(f"[{paper_site}] Failed to fetch details for {paper_page_url}")
+                return
+            write_paper_details_cache(paper_page_url, paper_details)
 
+    # Write the CSV row if the paper does not exist in CSV. Several links may resolve to the same
+    # paper: the title is recorded right away so that only the first one is written.
+    if not paper_exists_in_list(paper_details['title'], existing_papers):
+        existing_papers.add(paper_title_key(paper_details['title']))
         paper_details["referrer"] = referrer
-
-        with open(csv_file, 'a', newline='') as csvfile:
-            fieldnames = ['title', 'authors', 'pdf_link', 'topics', 'release_date', 'referrer']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writerow(paper_details)
+        appender.write(paper_details)
 
     # Define the potential file path
-    pdf_filename = f"{paper_details['title']}.pdf"
-    pdf_path = os.path.join(root_directory(), 'data', 'papers_pdf_downloads', pdf_filename)
-
-    # If PDF does not exist, download it
-    if not os.path.exists(pdf_path):
+    pdf_filename = pdf_filename_from_title(paper_details['title'])
+    pdf_path = os.path.join(pdf_directory, pdf_filename)
+
+    # If PDF does not exist, download it. Claim the file name first so that two links
+    # resolving to the same paper do not download it concurrently.
+    if pdf_filename not in existing_pdfs:
+        existing_pdfs.add(pdf_filename)
+        downloaded = False
+        # Some sites list the paper page as PDF link, and give the actual PDF location separately
+        pdf_link = paper_details.get('pdf_download_link', paper_details['pdf_link'])
         try:
-            pdf_content = download_pdf(paper_details['pdf_link'], '')
-            if pdf_content:
-                with open(pdf_path, "wb") as f:
-                    f.write(pdf_content)
+            async with pdf_semaphore:
+                downloaded = await download_pdf_async(session, pdf_link, paper_page_url, pdf_path)
+            if downloaded:
                 logging.info(f"[{paper_site}] Downloaded paper {pdf_filename}")
         except Exception as e:
             logging.error(f"Failed to download a valid PDF file from {link} after multiple attempts. Error: {e}")
+        if not downloaded:
+            existing_pdfs.discard(pdf_filename)
+
+
+async def download_and_save_papers_async(paper_site, paper_links_and_referrers, appender, existing_papers, parsing_method, prefetched_details, max_concurrency=MAX_CONCURRENT_PAPERS):
+    page_semaphore = asyncio.Semaphore(max_concurrency)
+    pdf_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PDF_DOWNLOADS)
+    # Parsing methods run in asyncio.to_thread: size the thread pool to the semaphore, the default pool
+    # has min(32, cpu_count + 4) threads and would otherwise cap the concurrency on small machines.
+    # asyncio.run shuts the executor down when the batch completes.
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=max_concurrency))
+    pdf_directory = papers_pdf_directory()
+    # One directory listing instead of an os.path.exists call per paper. PDFs truncated by a run
+    # that predates the temporary file downloads are left out, and downloaded again.
+    existing_pdfs = {entry.name for entry in os.scandir(pdf_directory) if entry.is_file() and entry.stat().st_size > MIN_PDF_SIZE} if os.path.isdir(pdf_directory) else set()
+    async with make_aiohttp_session() as session:
+        # Bind the state shared by the whole batch once, each task only receives its link and referrer
+        download_and_save_link = partial(download_and_save_unique_paper, session, page_semaphore, pdf_semaphore, paper_site, appender, existing_papers, pdf_directory, existing_pdfs, parsing_method, prefetched_details)
+        await asyncio.gather(*[download_and_save_link(link, referrer) for link, referrer in paper_links_and_referrers])
+
+
+def paper_link_key(link: str) -> str:
+    """
+    Normalize a paper link so that the variants of the same link compare equal: without .pdf suffix,
+    lowercase scheme and host, without trailing slash, fragment and utm_* tracking parameters.
+    """
+    parts = urlsplit(link.strip().replace('.pdf', ''))
+    query = urlencode([(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if not key.startswith('utm_')])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), query, ''))
 
 
-def download_and_save_paper(paper_site, paper_links_and_referrers, csv_file, parsing_method):
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
+def filter_seen_links(paper_links_and_referrers, seen_links: set):
+    """
+    Yield the (link, referrer) pairs whose link was not seen yet, across all the sites of a run.
 
-    existing_papers = read_existing_papers(csv_file)
+    Parameters:
+    - paper_links_and_referrers (iterable): The (link, referrer) pairs of a site.
+    - seen_links (set): Keys of the links already yielded, see paper_link_key. Updated as links are yielded.
+    """
+    for link, referrer in paper_links_and_referrers:
+        key = paper_link_key(link)
+        if key not in seen_links:
+            seen_links.add(key)
+            yield link, referrer
 
-    # Write header only if CSV file is empty (newly created)
-    if not existing_papers:
-        with open(csv_file, 'w', newline='') as csvfile:  # open in write mode only to write the header
-            fieldnames = ['title', 'authors', 'pdf_link', 'topics', 'release_date', 'referrer']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-
-    # Create a list of tuples where each tuple contains the arguments for a single call
-    # to download_and_save_unique_paper
-    tasks = [
-        (
-            paper_site,
-            link,
-            csv_file,
-            existing_papers,
-            headers,
-            referrer,
-            parsing_method
-        )
-        for link, referrer in paper_links_and_referrers
-    ]
 
-    # Use ProcessPoolExecutor to run tasks in parallel
-    with concurrent.futures.ProcessPoolExecutor() as executor:
-        executor.map(download_and_save_unique_paper, tasks)
+def download_and_save_paper(paper_site, paper_links_and_referrers, csv_file, parsing_method, prefetched_details=None, max_concurrency=MAX_CONCURRENT_PAPERS):
+    existing_papers = read_existing_papers(csv_file)
+
+    # The same paper may be listed several times, with or without its .pdf suffix: keep the first referrer.
+    # paper_links_and_referrers may be a generator, it is consumed once here.
+    unique_links_and_referrers = {}
+    for link, referrer in paper_links_and_referrers:
+        unique_links_and_referrers.setdefault(paper_link_key(link), (link.strip(), referrer))
+    paper_links_and_referrers = list(unique_links_and_referrers.values())
+
+    # Fetching is I/O-bound: schedule every link on one event loop, bounded by a semaphore.
+    # Rows are written as papers complete, all from the event loop thread.
+    with CsvAppender(csv_file, PAPER_DETAILS_FIELDNAMES) as appender:
+        asyncio.run(download_and_save_papers_async(paper_site, paper_links_and_referrers, appender, existing_papers, parsing_method, prefetched_details or {}, max_concurrency))
+    # Every title of the set was written to the CSV file, which is closed: index them for the next run
+    save_existing_papers_index(csv_file, existing_papers)
 
 
 def validate_pdfs(directory_path: Union[str, Path]):